@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import List, Optional, Dict
 import sys
 import random
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import queue
 import threading
 
@@ -35,7 +35,7 @@ except ImportError:
     print("pip install tqdm")
     exit(1)
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -44,7 +44,14 @@ from rich import box
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 
 # Import our metadata tagger module
-from modules.metadata_tagger import MetadataTagger, refresh_metadata_for_directory
+from modules.metadata_tagger import (
+    DEFAULT_SEEN_DB,
+    MetadataTagger,
+    iter_audio_files,
+    refresh_metadata_for_directory
+)
+from modules.utils import buffered_file_handler, create_http_session
+from modules.playlist_manager import SPOTIFY_PAGE_SIZE, SPOTIFY_TRACK_FIELDS
 
 console = Console()
 
@@ -52,6 +59,7 @@ console = Console()
 CONFIG_DIR = os.path.join(os.path.dirname(__file__), '.config')
 USER_FILE = os.path.join(CONFIG_DIR, 'user.json')
 ENV_FILE = os.path.join(CONFIG_DIR, '.env')
+SPOTIFY_CACHE_FILE = os.path.join(CONFIG_DIR, '.spotipy-cache')
 CONFIG_JSON = os.path.join(os.path.dirname(__file__), 'config.json')
 
 # === LOAD CONFIG FROM .env ===
@@ -94,10 +102,7 @@ AUDIO_FORMAT = os.getenv("AUDIO_FORMAT", "best")
 DOWNLOAD_DELAY = float(os.getenv("DOWNLOAD_DELAY", "1.5"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 YOUTUBE_COOKIES = os.getenv("YOUTUBE_COOKIES")  # Path to cookies file for YouTube auth
-SEARCH_DELAY_RANGE = (
-    float(os.getenv("SEARCH_DELAY_MIN", "0.5")),
-    float(os.getenv("SEARCH_DELAY_MAX", "1.5"))
-)
+SEARCH_RATE = float(os.getenv("SEARCH_RATE", "10.0"))  # Max YouTube searches per second
 START_DOWNLOAD_THRESHOLD = int(os.getenv("START_DOWNLOAD_THRESHOLD", "27"))
 
 PLAYLISTS_FILE = os.path.join(OUTPUT_DIR, "playlists.txt")
@@ -108,7 +113,7 @@ def setup_logging():
     log_dir = Path(os.path.dirname(__file__)) / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / f"download_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = buffered_file_handler(log_file, logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
     logging.basicConfig(
@@ -263,7 +268,17 @@ def playlist_labels_and_links():
         print(f"Warning: No valid playlists found in {PLAYLISTS_FILE}.")
     return labels, links, types
 
-def add_playlist_interactive():
+def create_spotify_client():
+    # Token cache lives next to .env so async_downloader reuses the same token
+    return spotipy.Spotify(auth_manager=SpotifyOAuth(
+        client_id=SPOTIFY_CLIENT_ID,
+        client_secret=SPOTIFY_CLIENT_SECRET,
+        redirect_uri=SPOTIFY_REDIRECT_URI,
+        scope="playlist-read-private playlist-read-collaborative",
+        cache_path=SPOTIFY_CACHE_FILE
+    ), requests_session=create_http_session())
+
+def add_playlist_interactive(sp):
     labels, _, _ = playlist_labels_and_links()
     console.rule("[bold cyan]Add a Playlist[/bold cyan]")
     if labels:
@@ -295,14 +310,8 @@ def add_playlist_interactive():
                 continue
             # Fetch playlist info for preview (as before)
             try:
-                sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-                    client_id=SPOTIFY_CLIENT_ID,
-                    client_secret=SPOTIFY_CLIENT_SECRET,
-                    redirect_uri=SPOTIFY_REDIRECT_URI,
-                    scope="playlist-read-private playlist-read-collaborative"
-                ))
                 playlist_id = extract_playlist_id(link)
-                playlist_info = sp.playlist(playlist_id)
+                playlist_info = sp.playlist(playlist_id, fields='name,owner(display_name),tracks.total,images(url)')
                 preview_table = Table(title="[bold magenta]Playlist Preview[/bold magenta]", box=box.ROUNDED)
                 preview_table.add_column("Field", style="cyan", no_wrap=True)
                 preview_table.add_column("Value", style="white")
@@ -330,13 +339,13 @@ def add_playlist_interactive():
         with open(PLAYLISTS_FILE, 'a', encoding='utf-8') as f:
             f.write(f"{label}:{ptype}:{link}\n")
         console.print(Panel.fit(f"Playlist '[bold]{label}[/bold]' added successfully! 🎉", style="green"))
+        labels.append(label)
         # Show summary table of all playlists
-        labels, _, _ = playlist_labels_and_links()
         table = Table(title="[bold]All Playlists[/bold]", box=box.SIMPLE)
         table.add_column("#", style="bold")
         table.add_column("Label", style="green")
-        for i, label in enumerate(labels, 1):
-            table.add_row(str(i), label)
+        for i, playlist_label in enumerate(labels, 1):
+            table.add_row(str(i), playlist_label)
         console.print(table)
         again = Prompt.ask("[bold]Add another playlist?[/bold] (y/n, or 'm' to go back)", choices=["y", "n", "m"], default="n", console=console).lower()
         if again == 'm' or again != 'y':
@@ -347,25 +356,28 @@ def add_playlist_interactive():
 def get_spotify_tracks(sp, playlist_url):
     try:
         playlist_id = extract_playlist_id(playlist_url)
-        playlist_info = sp.playlist(playlist_id)
+        playlist_info = sp.playlist(playlist_id, fields='name,tracks.total')
         playlist_name = sanitize_filename(playlist_info['name'])
         tracks = []
-        results = sp.playlist_tracks(playlist_id)
-        while results:
+        # Page by offset (known from the total) instead of following each page's next cursor
+        for offset in range(0, playlist_info['tracks']['total'], SPOTIFY_PAGE_SIZE):
+            results = sp.playlist_tracks(playlist_id, fields=SPOTIFY_TRACK_FIELDS,
+                                         limit=SPOTIFY_PAGE_SIZE, offset=offset)
             for item in results['items']:
-                if item['track'] and item['track']['name']:
-                    track = item['track']
-                    track_info = {
-                        'name': track['name'],
-                        'artist': track['artists'][0]['name'] if track['artists'] else 'Unknown Artist',
-                        'album': track['album']['name'] if track['album'] else 'Unknown Album',
-                        'duration_ms': track.get('duration_ms', 0),
-                    }
-                    tracks.append(track_info)
-            if results['next']:
-                results = sp.next(results)
-            else:
-                break
+                track = item.get('track')
+                if not track:
+                    continue
+                name = track.get('name')
+                if not name:
+                    continue
+                artists = track.get('artists')
+                album = track.get('album')
+                tracks.append({
+                    'name': name,
+                    'artist': artists[0]['name'] if artists else 'Unknown Artist',
+                    'album': album['name'] if album else 'Unknown Album',
+                    'duration_ms': track.get('duration_ms', 0),
+                })
         return playlist_name, tracks
     except Exception as e:
         print(f"Error fetching Spotify tracks: {e}")
@@ -373,8 +385,6 @@ def get_spotify_tracks(sp, playlist_url):
 
 def get_youtube_playlist_tracks_sync(playlist_url: str):
     """Fetches the YouTube playlist name and videos, returns (playlist_name, [track dicts with name, artist, url])"""
-    import subprocess
-    import json
     try:
         result = subprocess.run(
             ["yt-dlp", "-J", "--flat-playlist", playlist_url],
@@ -396,6 +406,26 @@ def get_youtube_playlist_tracks_sync(playlist_url: str):
         console.print(f"[red]Failed to fetch YouTube playlist info: {e}[/red]")
         return None, []
 
+AUDIO_EXTS = ('.mp3', '.m4a', '.opus', '.flac', '.wav', '.ogg', '.aac')
+
+def scan_local_files(playlist_dir):
+    """Returns the basenames of audio files in playlist_dir, creating it if needed"""
+    os.makedirs(playlist_dir, exist_ok=True)
+    local_files = set()
+    for f in os.listdir(playlist_dir):
+        base, ext = os.path.splitext(f)
+        if ext.lower() in AUDIO_EXTS:
+            local_files.add(base)
+    return local_files
+
+def index_local_files(playlist_names, max_workers=8):
+    """Scans all playlist folders concurrently, returns {playlist_name: set of basenames}"""
+    dir_names = {name: os.path.join(OUTPUT_DIR, name) for name in playlist_names}
+    if not dir_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(dir_names))) as pool:
+        return dict(zip(dir_names, pool.map(scan_local_files, dir_names.values())))
+
 def refresh_metadata_interactive(sp):
     """Interactive function to refresh metadata for audio files in download folders"""
     console.rule("[bold cyan]🎨 Refresh Metadata (High Quality)[/bold cyan]")
@@ -435,7 +465,7 @@ def refresh_metadata_interactive(sp):
             return
         
         # List available playlist folders
-        subdirs = [d for d in Path(OUTPUT_DIR).iterdir() if d.is_dir()]
+        subdirs = [d for d in Path(OUTPUT_DIR).iterdir() if d.is_dir() and not d.name.startswith('.')]
         if not subdirs:
             console.print(f"[red]No playlist folders found in {OUTPUT_DIR}[/red]")
             return
@@ -497,12 +527,8 @@ def refresh_metadata_interactive(sp):
         console.print("[yellow]Operation cancelled[/yellow]")
         return
     
-    # Initialize metadata tagger
-    console.print("\n[cyan]Initializing metadata tagger...[/cyan]")
-    tagger = MetadataTagger(sp=sp)
-    
-    # Find all audio files
-    audio_files = [f for f in target_dir.rglob("*") if f.is_file() and f.suffix.lower() in ['.mp3', '.flac', '.m4a', '.aac', '.opus', '.ogg']]
+    # Find all audio files (same walker and formats as the tagger's own directory scan)
+    audio_files = list(iter_audio_files(target_dir))
     
     if not audio_files:
         console.print(f"[yellow]No audio files found in {target_dir}[/yellow]")
@@ -510,20 +536,39 @@ def refresh_metadata_interactive(sp):
     
     console.print(f"[green]Found {len(audio_files)} audio files[/green]\n")
     
-    # Process files with progress bar
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("[cyan]Processing audio files...", total=len(audio_files))
-        
-        for file_path in audio_files:
-            progress.update(task, description=f"[cyan]Processing: {file_path.name[:40]}...")
-            success, status = tagger.process_file(file_path, force=force_update)
-            progress.advance(task)
+    # Initialize metadata tagger
+    console.print("[cyan]Initializing metadata tagger...[/cyan]")
+    tagger = MetadataTagger(sp=sp, seen_db=DEFAULT_SEEN_DB)
+    
+    # Files whose processing raised instead of returning a result
+    failed = 0
+    
+    try:
+        # Process files with progress bar
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console
+        ) as progress:
+            task = progress.add_task("[cyan]Processing audio files...", total=len(audio_files))
+            
+            # Tag several files at once so one file's Spotify lookup overlaps another's disk I/O
+            with ThreadPoolExecutor(max_workers=tagger.workers) as pool:
+                futures = {pool.submit(tagger.process_file, file_path, force_update): file_path
+                           for file_path in audio_files}
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed += 1
+                        progress.console.print(f"[red]Failed to process {file_path.name}: {e}[/red]")
+                    progress.update(task, description=f"[cyan]Processed: {file_path.name[:40]}...")
+                    progress.advance(task)
+    finally:
+        tagger.close()
     
     # Show results
     stats = tagger.get_stats()
@@ -536,6 +581,8 @@ def refresh_metadata_interactive(sp):
     results_table.add_row("Successfully Tagged", str(stats['tagged']), style="green")
     results_table.add_row("Already Had Metadata", str(stats['already_tagged']), style="yellow")
     results_table.add_row("No Match Found", str(stats['errors']), style="red")
+    if failed:
+        results_table.add_row("Failed", str(failed), style="bold red")
     console.print(results_table)
     
     if stats['tagged'] > 0:
@@ -588,12 +635,7 @@ def main():
             console.print("[yellow]No playlists found in playlists.txt.[/yellow]")
     else:
         console.print("[red]playlists.txt not found![/red]")
-    sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-        client_id=SPOTIFY_CLIENT_ID,
-        client_secret=SPOTIFY_CLIENT_SECRET,
-        redirect_uri=SPOTIFY_REDIRECT_URI,
-        scope="playlist-read-private playlist-read-collaborative"
-    ))
+    sp = create_spotify_client()
     # Call migration at startup
     migrate_playlists_file()
     while True:
@@ -610,7 +652,7 @@ def main():
         console.print(menu_panel)
         choice = Prompt.ask("[bold green]Choose an option (1-5)[/bold green]", choices=["1", "2", "3", "4", "5"], default="5", console=console)
         if choice == '1':
-            add_playlist_interactive()
+            add_playlist_interactive(sp)
         elif choice == '2':
             # Check for undownloaded songs
             _, links, _ = playlist_labels_and_links()
@@ -620,6 +662,7 @@ def main():
                 continue
             from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
             all_missing = []  # List of (playlist_name, label, missing list)
+            fetched = []  # List of (label, playlist_name, tracks)
             with Progress(SpinnerColumn(), TextColumn("{task.description}"), BarColumn(), transient=True, console=console) as progress:
                 task = progress.add_task("[cyan]Checking playlists...", total=len(links))
                 for label, ptype, link in links:
@@ -643,54 +686,47 @@ def main():
                         console.print(f"[red]Could not fetch playlist or no tracks found for {label}.[/red]")
                         progress.advance(task)
                         continue
-                    playlist_dir = os.path.join(OUTPUT_DIR, playlist_name)
-                    os.makedirs(playlist_dir, exist_ok=True)
-                    audio_exts = ['.mp3', '.m4a', '.opus', '.flac', '.wav', '.ogg', '.aac']
-                    local_files = set()
-                    for f in os.listdir(playlist_dir):
-                        base, ext = os.path.splitext(f)
-                        if ext.lower() in audio_exts:
-                            local_files.add(base)
-                    missing = []
-                    for t in tracks:
-                        fname = sanitize_filename(f"{t['artist']} - {t['name']}")
-                        if fname not in local_files:
-                            missing.append(f"{t['artist']} - {t['name']}")
-                    downloaded = len(tracks) - len(missing)
-                    # Playlist summary panel (improved)
-                    summary = Table.grid(expand=True)
-                    summary.add_row("")  # Spacer
-                    name_table = Table.grid(expand=True)
-                    name_table.add_column(justify="center")
-                    name_table.add_row(Text(playlist_name, style="bold magenta", justify="center"))
-                    summary.add_row(name_table)
-                    summary.add_row("")  # Spacer
-                    info_table = Table.grid(expand=True)
-                    info_table.add_column(justify="right", ratio=1)
-                    info_table.add_row(Text(f"Label: {label}", style="dim", justify="right"))
-                    info_table.add_row(Text(f"Tracks: {len(tracks)}", style="dim", justify="right"))
-                    info_table.add_row(Text(f"Downloaded: {downloaded}", style="dim", justify="right"))
-                    info_table.add_row(Text(f"Missing: {len(missing)}", style="dim", justify="right"))
-                    summary.add_row(info_table)
-                    summary.add_row("")  # Spacer
-                    console.print(Panel(summary, title="[bold magenta]Playlist Summary[/bold magenta]", expand=False))
-                    # Missing songs table
-                    if not missing:
-                        console.print("[bold green]All songs are downloaded! You're all caught up! 🎶[/bold green]")
-                    else:
-                        console.print(f"[yellow]Missing {len(missing)} songs:[/yellow]")
-                        song_table = Table(title="Missing Songs", box=box.MINIMAL_DOUBLE_HEAD)
-                        song_table.add_column("#", style="dim", width=4)
-                        song_table.add_column("Song", style="white")
-                        for i, m in enumerate(missing, 1):
-                            song_table.add_row(str(i), m)
-                        console.print(song_table)
-                        if len(missing) <= 5:
-                            console.print("[bold cyan]Almost there! Only a few songs left to download.[/bold cyan]")
-                        elif len(missing) > 20:
-                            console.print("[bold]Keep going! Your collection is growing![/bold]")
-                    all_missing.append((playlist_name, label, missing))
+                    fetched.append((label, playlist_name, tracks))
                     progress.advance(task)
+            # Scan every playlist folder in one concurrent pass
+            local_index = index_local_files(playlist_name for _, playlist_name, _ in fetched)
+            for label, playlist_name, tracks in fetched:
+                local_files = local_index[playlist_name]
+                missing = []
+                for t in tracks:
+                    fname = sanitize_filename(f"{t['artist']} - {t['name']}")
+                    if fname not in local_files:
+                        missing.append(f"{t['artist']} - {t['name']}")
+                downloaded = len(tracks) - len(missing)
+                # Playlist summary panel (improved)
+                name_table = Table.grid(expand=True)
+                name_table.add_column(justify="center")
+                name_table.add_row(Text(playlist_name, style="bold magenta", justify="center"))
+                info_table = Table.grid(expand=True)
+                info_table.add_column(justify="right", ratio=1)
+                info_table.add_row(Text(f"Label: {label}", style="dim", justify="right"))
+                info_table.add_row(Text(f"Tracks: {len(tracks)}", style="dim", justify="right"))
+                info_table.add_row(Text(f"Downloaded: {downloaded}", style="dim", justify="right"))
+                info_table.add_row(Text(f"Missing: {len(missing)}", style="dim", justify="right"))
+                # Collect everything for this playlist and render it in one print
+                renderables = [Panel(Group("", name_table, "", info_table, ""), title="[bold magenta]Playlist Summary[/bold magenta]", expand=False)]
+                # Missing songs table
+                if not missing:
+                    renderables.append("[bold green]All songs are downloaded! You're all caught up! 🎶[/bold green]")
+                else:
+                    renderables.append(f"[yellow]Missing {len(missing)} songs:[/yellow]")
+                    song_table = Table(title="Missing Songs", box=box.MINIMAL_DOUBLE_HEAD)
+                    song_table.add_column("#", style="dim", width=4)
+                    song_table.add_column("Song", style="white")
+                    for i, m in enumerate(missing, 1):
+                        song_table.add_row(str(i), m)
+                    renderables.append(song_table)
+                    if len(missing) <= 5:
+                        renderables.append("[bold cyan]Almost there! Only a few songs left to download.[/bold cyan]")
+                    elif len(missing) > 20:
+                        renderables.append("[bold]Keep going! Your collection is growing![/bold]")
+                console.print(Group(*renderables))
+                all_missing.append((playlist_name, label, missing))
             # Quick Download/Export/Back prompt
             options = {'d': 'Download all missing songs now', 'e': 'Export all missing lists', 'm': 'Main menu'}
             opt_str = ", ".join([f"[{k.upper()}]{v[1:]}" for k, v in options.items()])
@@ -706,6 +742,7 @@ def main():
                     '--audio-format', AUDIO_FORMAT,
                     '--audio-quality', AUDIO_QUALITY,
                     '--download-delay', str(DOWNLOAD_DELAY),
+                    '--search-rate', str(SEARCH_RATE),
                     '--output-dir', OUTPUT_DIR,
                     '--playlists-file', PLAYLISTS_FILE,
                     '--progress-file', PROGRESS_FILE,
@@ -724,8 +761,7 @@ def main():
                     if missing:
                         fname = f"missing_{playlist_name}.txt"
                         with open(fname, 'w', encoding='utf-8') as f:
-                            for song in missing:
-                                f.write(song + '\n')
+                            f.write('\n'.join(missing) + '\n')
                         console.print(f"[cyan]Exported missing songs for [bold]{playlist_name}[/bold] to [bold]{fname}[/bold].[/cyan]")
                 console.print("[green]Export complete![/green]")
             else:
@@ -741,6 +777,7 @@ def main():
                     '--audio-format', AUDIO_FORMAT,
                     '--audio-quality', AUDIO_QUALITY,
                     '--download-delay', str(DOWNLOAD_DELAY),
+                    '--search-rate', str(SEARCH_RATE),
                     '--output-dir', OUTPUT_DIR,
                     '--playlists-file', PLAYLISTS_FILE,
                     '--progress-file', PROGRESS_FILE,
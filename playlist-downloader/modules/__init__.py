@@ -8,5 +8,6 @@ __all__ = [
     'configure',
     'download_manager',
     'playlist_manager',
+    'search_cache',
     'utils'
 ]
@@ -11,8 +11,8 @@ This module orchestrates the entire download process:
 
 Performance optimizations:
 - Async I/O for network operations
-- Concurrent workers for search and download
-- Efficient queueing system
+- Per-job tasks with bounded search and download concurrency
+- Search and download stages overlap per track
 - Smart retry logic with exponential backoff
 """
 
@@ -21,6 +21,7 @@ import sys
 import asyncio
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from pathlib import Path
 
@@ -32,7 +33,14 @@ from tqdm import tqdm
 
 # Import our refactored modules
 from modules.config_manager import ConfigManager, AppConfig
-from modules.playlist_manager import PlaylistManager, SpotifyPlaylistFetcher, YouTubePlaylistFetcher
+from modules.playlist_manager import (
+    PlaylistCache,
+    PlaylistManager,
+    SpotifyPlaylistFetcher,
+    YouTubePlaylistFetcher
+)
+from modules.search_cache import SearchCache
+from modules.browser_auth import setup_browser_cookies_async
 from modules.download_manager import (
     DownloadManager,
     YouTubeSearcher,
@@ -40,12 +48,17 @@ from modules.download_manager import (
     DownloadJob,
     DownloadStatus
 )
-from modules.utils import setup_logging, get_downloaded_files, ensure_directory
+from modules.utils import (
+    CACHE_DIR,
+    create_http_session,
+    ensure_directory,
+    get_downloaded_files,
+    setup_logging
+)
 
 # Initialize Rich console for beautiful output
 console = Console()
 
-
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -59,10 +72,12 @@ def parse_arguments() -> argparse.Namespace:
     )
     
     # Worker configuration
-    parser.add_argument('--search-workers', type=int, default=3,
-                        help='Number of concurrent search workers')
-    parser.add_argument('--download-workers', type=int, default=3,
-                        help='Number of concurrent download workers')
+    parser.add_argument('--search-workers', '--max-concurrent-search', dest='search_workers',
+                        type=int, default=3,
+                        help='Maximum number of concurrent searches')
+    parser.add_argument('--download-workers', '--max-concurrent-download', dest='download_workers',
+                        type=int, default=3,
+                        help='Maximum number of concurrent downloads')
     
     # Audio configuration
     parser.add_argument('--audio-format', type=str, default='best',
@@ -89,14 +104,18 @@ def parse_arguments() -> argparse.Namespace:
                         help='Spotify OAuth redirect URI')
     
     # Search configuration
-    parser.add_argument('--search-delay-min', type=float, default=0.5,
-                        help='Minimum delay between searches')
-    parser.add_argument('--search-delay-max', type=float, default=1.5,
-                        help='Maximum delay between searches')
+    parser.add_argument('--search-rate', type=float, default=10.0,
+                        help='Maximum searches per second (halved automatically on HTTP 429)')
     
     # YouTube cookies (optional)
     parser.add_argument('--youtube-cookies', type=str, default=None,
                         help='Path to YouTube cookies file for authenticated access')
+    parser.add_argument('--setup-cookies', action='store_true',
+                        help='Interactively extract YouTube cookies from a browser if none are given')
+    
+    # Search cache
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='Discard cached YouTube search results and search again')
     
     return parser.parse_args()
 
@@ -127,12 +146,20 @@ async def main():
     # Ensure output directory exists
     ensure_directory(args.output_dir)
     
+    # One connection pool for the whole run (token refresh and API calls)
+    http_session = create_http_session()
+    
+    # Unchanged Spotify playlists are served from disk
+    playlist_cache = PlaylistCache(os.path.join(CACHE_DIR, 'playlists.json'))
+    
     # Initialize playlist manager
     try:
         spotify_fetcher = SpotifyPlaylistFetcher(
             client_id=args.spotify_client_id,
             client_secret=args.spotify_client_secret,
-            redirect_uri=args.spotify_redirect_uri
+            redirect_uri=args.spotify_redirect_uri,
+            session=http_session,
+            playlist_cache=playlist_cache
         )
         youtube_fetcher = YouTubePlaylistFetcher()
         playlist_manager = PlaylistManager(spotify_fetcher, youtube_fetcher)
@@ -143,7 +170,7 @@ async def main():
         return 1
     
     # Load playlist references from file
-    playlist_refs = playlist_manager.load_playlist_file(args.playlists_file)
+    playlist_refs = await playlist_manager.load_playlist_file_async(args.playlists_file)
     
     if not playlist_refs:
         console.print(f"[red]No playlists found in {args.playlists_file}[/red]")
@@ -155,6 +182,7 @@ async def main():
     # Fetch all playlists
     console.print("[blue]Fetching playlist metadata...[/blue]")
     playlists = await playlist_manager.fetch_playlists_async(playlist_refs)
+    playlist_cache.save()
     
     if not playlists:
         console.print("[red]Failed to fetch any playlists[/red]")
@@ -164,36 +192,51 @@ async def main():
     jobs: List[DownloadJob] = []
     total_tracks = 0
     already_downloaded = 0
+    duplicate_tracks = 0
+    
+    # Output directory was created above; playlist folders are created lazily
+    base_dir = Path(args.output_dir)
     
     for playlist in playlists:
-        total_tracks += len(playlist)
+        playlist_path = base_dir / playlist.sanitized_name
+        playlist_dir = str(playlist_path)
         
-        # Create directory for playlist
-        playlist_dir = os.path.join(args.output_dir, playlist.sanitized_name)
-        ensure_directory(playlist_dir)
-        
-        # Get already downloaded files
+        # Get already downloaded files (frozenset: O(1) lookups per track)
         local_files = get_downloaded_files(playlist_dir)
         
+        # Tracks indexed by filename once per playlist; split downloaded/missing with set algebra
+        wanted = playlist.tracks_by_filename
+        already_downloaded += len(wanted.keys() & local_files)
+        
+        # Tracks sharing a filename are one file on disk, so they're counted once
+        total_tracks += len(wanted)
+        duplicate_tracks += len(playlist) - len(wanted)
+        
         # Create jobs for missing tracks
-        for track in playlist.tracks:
-            if track.filename in local_files:
-                already_downloaded += 1
-            else:
-                job = DownloadJob(
-                    track_name=track.name,
-                    artist=track.artist,
-                    filename=track.filename,
-                    output_dir=playlist_dir,
-                    youtube_url=track.url  # Will be None for Spotify tracks
-                )
-                jobs.append(job)
+        playlist_jobs = [
+            DownloadJob(
+                track_name=track.name,
+                artist=track.artist,
+                filename=filename,
+                output_dir=playlist_dir,
+                youtube_url=track.url  # Will be None for Spotify tracks
+            )
+            for filename, track in wanted.items()
+            if filename not in local_files
+        ]
+        
+        # Only playlists with something to download need their directory
+        if playlist_jobs:
+            playlist_path.mkdir(exist_ok=True)
+            jobs.extend(playlist_jobs)
     
     # Display summary before download
     summary_table = Table(title="[bold cyan]Download Summary[/bold cyan]", box=box.SIMPLE)
     summary_table.add_column("[bold]Metric[/bold]", style="yellow")
     summary_table.add_column("[bold]Value[/bold]", style="white")
     summary_table.add_row("Total tracks", str(total_tracks))
+    if duplicate_tracks:
+        summary_table.add_row("Duplicates skipped", f"[dim]{duplicate_tracks}[/dim]")
     summary_table.add_row("Already downloaded", f"[green]{already_downloaded}[/green]")
     summary_table.add_row("Need to download", f"[magenta]{len(jobs)}[/magenta]")
     console.print(summary_table)
@@ -206,38 +249,55 @@ async def main():
     # Get cookies file if provided
     cookies_file = args.youtube_cookies if args.youtube_cookies and os.path.exists(args.youtube_cookies) else None
     
+    if not cookies_file and args.setup_cookies:
+        cookies_file = await setup_browser_cookies_async()
+    
     if cookies_file:
         console.print(f"[cyan]✓ Using YouTube cookies from: {cookies_file}[/cyan]")
     else:
         console.print("[yellow]⚠ No YouTube cookies - age-restricted videos may fail[/yellow]")
     
+    # Previously resolved searches are reused across runs
+    search_cache = SearchCache(os.path.join(CACHE_DIR, 'search.sqlite'))
+    if args.refresh_cache:
+        search_cache.clear()
+    
+    # One thread pool shared by in-process searches and downloads
+    ydl_executor = ThreadPoolExecutor(
+        max_workers=args.search_workers + args.download_workers,
+        thread_name_prefix='yt-dlp'
+    )
+    
     # Initialize download manager
     searcher = YouTubeSearcher(
-        delay_min=args.search_delay_min,
-        delay_max=args.search_delay_max,
+        rate_limit=args.search_rate,
         max_retries=3,
-        cookies_file=cookies_file
+        cookies_file=cookies_file,
+        cache=search_cache,
+        executor=ydl_executor
     )
     
     downloader = YouTubeDownloader(
         audio_format=args.audio_format,
         audio_quality=args.audio_quality,
         max_retries=3,
-        cookies_file=cookies_file
+        cookies_file=cookies_file,
+        executor=ydl_executor
     )
     
-    # Progress tracking with tqdm
+    # Progress tracking with tqdm, redraws throttled to ~4Hz / 0.5% steps
     progress_bar = tqdm(
         total=len(jobs),
         desc="Downloading",
         unit="track",
-        colour="green"
+        colour="green",
+        mininterval=0.25,
+        miniters=max(1, len(jobs) // 200)
     )
     
-    def progress_callback(status: str, completed: int, total: int):
-        """Update progress bar."""
-        progress_bar.n = completed
-        progress_bar.refresh()
+    def progress_callback(status: str, finished: int, total: int):
+        """Update progress bar (tqdm decides when to redraw)."""
+        progress_bar.update(finished - progress_bar.n)
     
     download_manager = DownloadManager(
         searcher=searcher,
@@ -252,6 +312,9 @@ async def main():
     results = await download_manager.process_jobs(jobs)
     
     progress_bar.close()
+    ydl_executor.shutdown()
+    searcher.close()
+    search_cache.close()
     
     # Display results summary
     console.rule("[bold magenta]Summary[/bold magenta]", style="magenta")
@@ -301,6 +364,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Optional faster event loop (Linux/macOS only: pip install uvloop)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
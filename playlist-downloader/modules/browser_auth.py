@@ -9,12 +9,51 @@ Designed for non-technical users - they just need to be logged into YouTube
 in their browser and answer simple prompts.
 """
 
+import asyncio
 import os
+import re
 import sys
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional, Tuple
 
+try:
+    from yt_dlp.cookies import extract_cookies_from_browser
+    YT_DLP_AVAILABLE = True
+except ImportError:
+    YT_DLP_AVAILABLE = False
+
+# Matches the YOUTUBE_COOKIES entry of a .env file
+YOUTUBE_COOKIES_LINE = re.compile(r'^YOUTUBE_COOKIES=.*$', re.MULTILINE)
+
+# Executable names per browser (yt-dlp browser name -> commands on PATH)
+_BROWSER_CHECKS = {
+    'chrome': ('google-chrome', 'chrome', 'chromium'),
+    'firefox': ('firefox',),
+    'edge': ('microsoft-edge', 'msedge'),
+    'opera': ('opera',),
+    'brave': ('brave-browser', 'brave'),
+    'safari': ('safari',),  # macOS only
+}
+
+# Windows registry App Paths entries per browser
+_WINDOWS_REG_PATHS = {
+    'chrome': r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe',
+    'firefox': r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\firefox.exe',
+    'edge': r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\msedge.exe',
+}
+
+# macOS application bundle names per browser
+_MACOS_APP_NAMES = {
+    'chrome': 'Google Chrome.app',
+    'firefox': 'Firefox.app',
+    'edge': 'Microsoft Edge.app',
+    'opera': 'Opera.app',
+    'brave': 'Brave Browser.app',
+    'safari': 'Safari.app',
+}
+
 
 def detect_browsers() -> list[str]:
     """
@@ -25,73 +64,78 @@ def detect_browsers() -> list[str]:
     """
     browsers = []
     
-    # Common browser names for yt-dlp
-    browser_checks = {
-        'chrome': ['google-chrome', 'chrome', 'chromium'],
-        'firefox': ['firefox'],
-        'edge': ['microsoft-edge', 'msedge'],
-        'opera': ['opera'],
-        'brave': ['brave-browser', 'brave'],
-        'safari': ['safari'],  # macOS only
-    }
-    
     # Platform-specific detection
     if sys.platform == 'win32':
         # Windows - check common install paths
         import winreg
-        browser_paths = {
-            'chrome': r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe',
-            'firefox': r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\firefox.exe',
-            'edge': r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\msedge.exe',
-        }
         
-        for browser, reg_path in browser_paths.items():
-            try:
-                winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path)
-                browsers.append(browser)
-            except:
+        for browser, reg_path in _WINDOWS_REG_PATHS.items():
+            # HKCU is only consulted when HKLM has no entry
+            for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
                 try:
-                    winreg.OpenKey(winreg.HKEY_CURRENT_USER, reg_path)
+                    winreg.CloseKey(winreg.OpenKey(hive, reg_path))
                     browsers.append(browser)
-                except:
+                    break
+                except OSError:
                     pass
     
     elif sys.platform == 'darwin':
-        # macOS - check Applications folder
-        apps_dir = Path('/Applications')
-        browser_apps = {
-            'chrome': 'Google Chrome.app',
-            'firefox': 'Firefox.app',
-            'edge': 'Microsoft Edge.app',
-            'opera': 'Opera.app',
-            'brave': 'Brave Browser.app',
-            'safari': 'Safari.app',
-        }
+        # macOS - list Applications folder once
+        try:
+            with os.scandir('/Applications') as entries:
+                installed = {entry.name for entry in entries}
+        except OSError:
+            installed = set()
         
-        for browser, app_name in browser_apps.items():
-            if (apps_dir / app_name).exists():
+        for browser, app_name in _MACOS_APP_NAMES.items():
+            if app_name in installed:
                 browsers.append(browser)
     
     else:
-        # Linux - check if command exists
-        for browser, commands in browser_checks.items():
-            for cmd in commands:
-                try:
-                    result = subprocess.run(['which', cmd], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        browsers.append(browser)
-                        break
-                except:
-                    pass
+        # Linux - check if command exists on PATH
+        for browser, commands in _BROWSER_CHECKS.items():
+            if any(shutil.which(cmd) for cmd in commands):
+                browsers.append(browser)
     
     # Remove duplicates and return
     return list(dict.fromkeys(browsers))
 
 
+def _extract_cookies_subprocess(browser: str, cookies_file: str) -> None:
+    """
+    Extract cookies by running the yt-dlp CLI (fallback when yt_dlp isn't importable).
+    
+    Args:
+        browser: Browser name (chrome, firefox, edge, etc.)
+        cookies_file: Path where to save cookies
+    """
+    # No URL on purpose: yt-dlp loads the browser cookies and writes the
+    # cookie jar when it shuts down, even though it then exits with a
+    # "no URL" usage error. The exit code is ignored; the caller checks
+    # the cookies file instead. This avoids fetching any video page.
+    cmd = [
+        'yt-dlp',
+        '--cookies-from-browser', browser,
+        '--cookies', cookies_file,
+        '--no-warnings',
+    ]
+    
+    subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+
+
 def extract_cookies(browser: str, cookies_file: str) -> Tuple[bool, str]:
     """
     Extract cookies from browser using yt-dlp.
     
+    Reads the browser's cookie store directly through the yt_dlp Python
+    API, without any network request. Falls back to the yt-dlp CLI if the
+    package can't be imported.
+    
     Args:
         browser: Browser name (chrome, firefox, edge, etc.)
         cookies_file: Path where to save cookies
@@ -100,23 +144,11 @@ def extract_cookies(browser: str, cookies_file: str) -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        # Use yt-dlp to extract cookies from browser
-        # We'll use a dummy URL and just extract cookies
-        cmd = [
-            'yt-dlp',
-            '--cookies-from-browser', browser,
-            '--cookies', cookies_file,
-            '--skip-download',
-            '--no-warnings',
-            'https://www.youtube.com/watch?v=dQw4w9WgXcQ'  # Dummy video
-        ]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        if YT_DLP_AVAILABLE:
+            jar = extract_cookies_from_browser(browser)
+            jar.save(cookies_file, ignore_discard=True, ignore_expires=True)
+        else:
+            _extract_cookies_subprocess(browser, cookies_file)
         
         # Check if cookies file was created
         if os.path.exists(cookies_file) and os.path.getsize(cookies_file) > 0:
@@ -132,17 +164,18 @@ def extract_cookies(browser: str, cookies_file: str) -> Tuple[bool, str]:
         return False, f"Error extracting cookies: {e}"
 
 
-def setup_browser_cookies(cookies_dir: str = ".config") -> Optional[str]:
-    """
-    Interactive setup for browser cookies.
-    Guides non-technical users through the process.
-    
-    Args:
-        cookies_dir: Directory to store cookies file
-        
-    Returns:
-        Path to cookies file if successful, None otherwise
-    """
+async def _ainput(prompt: str) -> str:
+    """Read a line from stdin in a worker thread so the event loop keeps running."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, input, prompt)
+
+
+# Browser names accepted when typed instead of picked by number
+_BROWSER_NAMES = ('chrome', 'firefox', 'edge', 'opera', 'brave', 'safari', 'chromium')
+
+
+def _print_intro() -> None:
+    """Explain why browser cookies are needed."""
     print("\n" + "=" * 60)
     print("  YouTube Browser Login Setup")
     print("=" * 60)
@@ -154,14 +187,21 @@ def setup_browser_cookies(cookies_dir: str = ".config") -> Optional[str]:
     print("YouTube login cookies so the downloader can access the same")
     print("videos you can watch in your browser.")
     print()
+
+
+def _print_skipped() -> None:
+    """Tell the user setup was skipped."""
+    print("Skipping browser login setup.")
+    print("Note: You may not be able to download some videos.")
+
+
+def _show_browser_menu() -> list[str]:
+    """
+    Detect installed browsers and print the numbered choice list.
     
-    # Ask if user wants to set this up
-    response = input("Would you like to set this up now? (y/n) [y]: ").strip().lower()
-    if response == 'n':
-        print("Skipping browser login setup.")
-        print("Note: You may not be able to download some videos.")
-        return None
-    
+    Returns:
+        Browser names in menu order
+    """
     print()
     print("=" * 60)
     print()
@@ -186,48 +226,70 @@ def setup_browser_cookies(cookies_dir: str = ".config") -> Optional[str]:
         print(f"  {i}. {browser.title()}")
     
     print()
+    return browsers
+
+
+def _parse_browser_choice(choice: str, browsers: list[str]) -> Optional[str]:
+    """
+    Resolve a menu answer to a browser name.
     
-    # Get user choice
-    while True:
-        choice = input(f"Choose browser (1-{len(browsers)}) or type name: ").strip().lower()
-        
-        # Check if it's a number
-        if choice.isdigit():
-            idx = int(choice) - 1
-            if 0 <= idx < len(browsers):
-                selected_browser = browsers[idx]
-                break
-        # Check if it's a browser name
-        elif choice in ['chrome', 'firefox', 'edge', 'opera', 'brave', 'safari', 'chromium']:
-            selected_browser = choice
-            break
+    Args:
+        choice: What the user typed (number or browser name)
+        browsers: Browser names in menu order
         
-        print("Invalid choice. Please try again.")
+    Returns:
+        Selected browser name, or None if the answer is invalid
+    """
+    choice = choice.strip().lower()
+    
+    # Check if it's a number
+    if choice.isdigit():
+        idx = int(choice) - 1
+        if 0 <= idx < len(browsers):
+            return browsers[idx]
+    # Check if it's a browser name
+    elif choice in _BROWSER_NAMES:
+        return choice
+    
+    print("Invalid choice. Please try again.")
+    return None
+
+
+def _prepare_cookies_file(cookies_dir: str, browser: str) -> str:
+    """
+    Create the cookies directory and announce the extraction.
     
+    Args:
+        cookies_dir: Directory to store cookies file
+        browser: Selected browser name
+        
+    Returns:
+        Path the cookies file will be written to
+    """
     print()
-    print(f"Using {selected_browser.title()}...")
+    print(f"Using {browser.title()}...")
     print()
     
     # Create cookies directory
     cookies_path = Path(cookies_dir)
     cookies_path.mkdir(parents=True, exist_ok=True)
     
-    cookies_file = str(cookies_path / "youtube_cookies.txt")
-    
     # Extract cookies
     print("Extracting YouTube cookies from your browser...")
     print("(This may take a few seconds)")
     print()
     
-    success, message = extract_cookies(selected_browser, cookies_file)
-    
+    return str(cookies_path / "youtube_cookies.txt")
+
+
+def _report_extraction(success: bool, message: str, cookies_file: str) -> None:
+    """Print the outcome of a cookie extraction, with tips on failure."""
     if success:
         print(f"✓ {message}")
         print(f"✓ Cookies saved to {cookies_file}")
         print()
         print("You're all set! The downloader will now be able to access")
         print("the same videos you can watch when logged into YouTube.")
-        return cookies_file
     else:
         print(f"✗ {message}")
         print()
@@ -237,12 +299,91 @@ def setup_browser_cookies(cookies_dir: str = ".config") -> Optional[str]:
         print("  3. Close and reopen your browser, then try again")
         print("  4. Try a different browser")
         print()
+
+
+def setup_browser_cookies(cookies_dir: str = ".config") -> Optional[str]:
+    """
+    Interactive setup for browser cookies.
+    Guides non-technical users through the process.
+    
+    Reads prompts with plain input() on the calling thread, so Ctrl+C
+    interrupts it immediately.
+    
+    Args:
+        cookies_dir: Directory to store cookies file
         
-        retry = input("Would you like to try again? (y/n) [y]: ").strip().lower()
-        if retry != 'n':
-            return setup_browser_cookies(cookies_dir)
+    Returns:
+        Path to cookies file if successful, None otherwise
+    """
+    while True:
+        _print_intro()
+        
+        # Ask if user wants to set this up
+        if input("Would you like to set this up now? (y/n) [y]: ").strip().lower() == 'n':
+            _print_skipped()
+            return None
+        
+        browsers = _show_browser_menu()
+        
+        # Get user choice
+        selected_browser = None
+        while selected_browser is None:
+            selected_browser = _parse_browser_choice(
+                input(f"Choose browser (1-{len(browsers)}) or type name: "), browsers
+            )
+        
+        cookies_file = _prepare_cookies_file(cookies_dir, selected_browser)
+        success, message = extract_cookies(selected_browser, cookies_file)
+        _report_extraction(success, message, cookies_file)
+        if success:
+            return cookies_file
+        
+        if input("Would you like to try again? (y/n) [y]: ").strip().lower() == 'n':
+            return None
+
+
+async def setup_browser_cookies_async(cookies_dir: str = ".config") -> Optional[str]:
+    """
+    Interactive setup for browser cookies, for use inside a running event loop.
+    
+    Same flow as setup_browser_cookies, but prompts and cookie extraction
+    run in worker threads so other tasks keep running.
+    
+    Args:
+        cookies_dir: Directory to store cookies file
+        
+    Returns:
+        Path to cookies file if successful, None otherwise
+    """
+    loop = asyncio.get_running_loop()
+    
+    while True:
+        _print_intro()
+        
+        # Ask if user wants to set this up
+        if (await _ainput("Would you like to set this up now? (y/n) [y]: ")).strip().lower() == 'n':
+            _print_skipped()
+            return None
+        
+        browsers = _show_browser_menu()
+        
+        # Get user choice
+        selected_browser = None
+        while selected_browser is None:
+            selected_browser = _parse_browser_choice(
+                await _ainput(f"Choose browser (1-{len(browsers)}) or type name: "), browsers
+            )
+        
+        cookies_file = _prepare_cookies_file(cookies_dir, selected_browser)
+        success, message = await loop.run_in_executor(
+            None, extract_cookies, selected_browser, cookies_file
+        )
+        _report_extraction(success, message, cookies_file)
+        if success:
+            return cookies_file
         
-        return None
+        if (await _ainput("Would you like to try again? (y/n) [y]: ")).strip().lower() == 'n':
+            return None
 
 
 def get_cookies_file(cookies_dir: str = ".config") -> Optional[str]:
@@ -287,18 +428,11 @@ def main():
             # Read existing .env
             env_content = env_file.read_text()
             
-            # Update or add YOUTUBE_COOKIES
-            if 'YOUTUBE_COOKIES=' in env_content:
-                # Replace existing line
-                lines = env_content.split('\n')
-                new_lines = []
-                for line in lines:
-                    if line.startswith('YOUTUBE_COOKIES='):
-                        new_lines.append(f'YOUTUBE_COOKIES={cookies_file}')
-                    else:
-                        new_lines.append(line)
-                env_content = '\n'.join(new_lines)
-            else:
+            # Replace existing YOUTUBE_COOKIES line in one pass
+            env_content, replaced = YOUTUBE_COOKIES_LINE.subn(
+                lambda _: f'YOUTUBE_COOKIES={cookies_file}', env_content, count=1
+            )
+            if not replaced:
                 # Append new line
                 if not env_content.endswith('\n'):
                     env_content += '\n'
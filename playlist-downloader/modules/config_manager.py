@@ -8,10 +8,80 @@ Handles environment variables, JSON config, and provides defaults.
 import os
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from dotenv import load_dotenv
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+
+from modules.utils import ensure_directory, json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+
+# Environment-backed settings: (AppConfig field, env variable, default, type)
+_ENV_SPEC = (
+    # Spotify API
+    ('spotify_client_id', 'SPOTIFY_CLIENT_ID', '', str),
+    ('spotify_client_secret', 'SPOTIFY_CLIENT_SECRET', '', str),
+    ('spotify_redirect_uri', 'SPOTIFY_REDIRECT_URI', 'http://127.0.0.1:8000/callback', str),
+    
+    # Download Settings
+    ('output_dir', 'OUTPUT_DIR', './downloads', str),
+    ('audio_quality', 'AUDIO_QUALITY', '320K', str),
+    ('audio_format', 'AUDIO_FORMAT', 'best', str),
+    ('download_delay', 'DOWNLOAD_DELAY', '1.5', float),
+    ('max_retries', 'MAX_RETRIES', '3', int),
+    
+    # Search Settings
+    ('search_rate', 'SEARCH_RATE', '10.0', float),
+    
+    # System Paths
+    ('ffmpeg_path', 'FFMPEG_PATH', 'ffmpeg', str),
+    
+    # Advanced Settings
+    ('start_download_threshold', 'START_DOWNLOAD_THRESHOLD', '7', int),
+)
+
+
+# Settings that no longer have any effect: (env variable, replacement)
+_OBSOLETE_ENV = (
+    ('SEARCH_DELAY_MIN', 'SEARCH_RATE'),
+    ('SEARCH_DELAY_MAX', 'SEARCH_RATE'),
+)
+
+
+def _read_env_settings(_spec=_ENV_SPEC, _getenv=os.getenv) -> Dict[str, Any]:
+    """Read every environment-backed setting, applying defaults and types."""
+    return {field: cast(_getenv(env, default)) for field, env, default, cast in _spec}
+
+
+# Parsed JSON files keyed by path: (st_mtime_ns, data)
+_json_cache: Dict[Path, Tuple[int, Any]] = {}
+
+
+def _read_json_cached(path: Path) -> Any:
+    """
+    Load a JSON file, reusing the previous result while its mtime is unchanged.
+    
+    Args:
+        path: JSON file to read
+        
+    Returns:
+        Parsed JSON data (shared with later calls - don't mutate it)
+        
+    Raises:
+        OSError: If the file can't be read
+        json.JSONDecodeError: If the file isn't valid JSON
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _json_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with open(path, 'rb') as f:
+        data = json_loads(f.read())
+    _json_cache[path] = (mtime_ns, data)
+    return data
 
 
 @dataclass
@@ -33,8 +103,7 @@ class AppConfig:
     max_retries: int = 3
     
     # Search Settings
-    search_delay_min: float = 0.5
-    search_delay_max: float = 1.5
+    search_rate: float = 10.0  # Maximum YouTube searches per second
     
     # Worker Settings (auto-detected or from config.json)
     search_workers: int = 3
@@ -49,10 +118,7 @@ class AppConfig:
     start_download_threshold: int = 7
     
     def __post_init__(self):
-        """Validate and normalize configuration after initialization."""
-        # Ensure output directory exists
-        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
-        
+        """Normalize configuration after initialization (no disk access)."""
         # Set dependent file paths if not set
         if not self.playlists_file:
             self.playlists_file = os.path.join(self.output_dir, "playlists.txt")
@@ -60,17 +126,22 @@ class AppConfig:
             self.progress_file = os.path.join(self.output_dir, "progress.json")
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return asdict(self)
+        """Convert config to dictionary (all fields are flat values, no deep copy needed)."""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AppConfig':
         """Create config from dictionary."""
         # Filter to only valid fields
-        valid_fields = {k: v for k, v in data.items() if k in cls.__annotations__}
+        valid_fields = {k: v for k, v in data.items() if k in _VALID_FIELDS}
         return cls(**valid_fields)
 
 
+# AppConfig field names, used by to_dict and to filter from_dict input
+_FIELD_NAMES = tuple(f.name for f in fields(AppConfig))
+_VALID_FIELDS = frozenset(_FIELD_NAMES)
+
+
 class ConfigManager:
     """
     Manages loading and validation of application configuration.
@@ -92,10 +163,9 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.env_file = self.config_dir / ".env"
         self.config_json_path = Path(config_json_path)
-        self.logger = logging.getLogger(__name__)
         
         # Ensure config directory exists
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory(self.config_dir)
     
     def load_config(self) -> AppConfig:
         """
@@ -107,44 +177,27 @@ class ConfigManager:
         Raises:
             ValueError: If required configuration is missing
         """
+        from dotenv import load_dotenv
+        
         # Load environment variables
         if self.env_file.exists():
             load_dotenv(dotenv_path=self.env_file)
-            self.logger.info(f"Loaded environment from {self.env_file}")
+            logger.info(f"Loaded environment from {self.env_file}")
         else:
-            self.logger.warning(f"Environment file not found: {self.env_file}")
+            logger.warning(f"Environment file not found: {self.env_file}")
         
         # Load system resource config
         system_config = self._load_system_config()
         
         # Build configuration from environment variables
-        config_data = {
-            # Spotify API
-            'spotify_client_id': os.getenv('SPOTIFY_CLIENT_ID', ''),
-            'spotify_client_secret': os.getenv('SPOTIFY_CLIENT_SECRET', ''),
-            'spotify_redirect_uri': os.getenv('SPOTIFY_REDIRECT_URI', 'http://127.0.0.1:8000/callback'),
-            
-            # Download Settings
-            'output_dir': os.getenv('OUTPUT_DIR', './downloads'),
-            'audio_quality': os.getenv('AUDIO_QUALITY', '320K'),
-            'audio_format': os.getenv('AUDIO_FORMAT', 'best'),
-            'download_delay': float(os.getenv('DOWNLOAD_DELAY', '1.5')),
-            'max_retries': int(os.getenv('MAX_RETRIES', '3')),
-            
-            # Search Settings
-            'search_delay_min': float(os.getenv('SEARCH_DELAY_MIN', '0.5')),
-            'search_delay_max': float(os.getenv('SEARCH_DELAY_MAX', '1.5')),
-            
-            # Worker Settings (prefer system config)
-            'search_workers': system_config.get('max_threads', 3),
-            'download_workers': system_config.get('max_processes', 3),
-            
-            # System Paths
-            'ffmpeg_path': os.getenv('FFMPEG_PATH', 'ffmpeg'),
-            
-            # Advanced Settings
-            'start_download_threshold': int(os.getenv('START_DOWNLOAD_THRESHOLD', '7')),
-        }
+        config_data = _read_env_settings()
+        for env, replacement in _OBSOLETE_ENV:
+            if os.getenv(env) is not None:
+                logger.warning(f"{env} is no longer used and is ignored; set {replacement} instead")
+        
+        # Worker Settings (prefer system config)
+        config_data['search_workers'] = system_config.get('max_threads', 3)
+        config_data['download_workers'] = system_config.get('max_processes', 3)
         
         config = AppConfig.from_dict(config_data)
         
@@ -160,17 +213,16 @@ class ConfigManager:
         Returns:
             Dictionary with system configuration or empty dict if not found
         """
-        if not self.config_json_path.exists():
-            self.logger.warning(f"System config not found: {self.config_json_path}")
-            return {}
-        
         try:
-            with open(self.config_json_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                self.logger.info(f"Loaded system config: {config}")
-                return config
+            config = _read_json_cached(self.config_json_path)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Loaded system config: {config}")
+            return config
+        except FileNotFoundError:
+            logger.warning(f"System config not found: {self.config_json_path}")
+            return {}
         except (json.JSONDecodeError, IOError) as e:
-            self.logger.error(f"Failed to load system config: {e}")
+            logger.error(f"Failed to load system config: {e}")
             return {}
     
     def _validate_config(self, config: AppConfig) -> None:
@@ -199,8 +251,8 @@ class ConfigManager:
         if config.search_workers < 1 or config.download_workers < 1:
             raise ValueError("Worker counts must be at least 1")
         
-        if config.search_delay_min < 0 or config.search_delay_max < config.search_delay_min:
-            raise ValueError("Invalid search delay range")
+        if config.search_rate <= 0:
+            raise ValueError("SEARCH_RATE must be positive")
     
     def save_user_preference(self, key: str, value: Any) -> None:
         """
@@ -214,20 +266,19 @@ class ConfigManager:
         
         # Load existing preferences
         preferences = {}
-        if user_file.exists():
-            try:
-                with open(user_file, 'r', encoding='utf-8') as f:
-                    preferences = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            preferences = dict(_read_json_cached(user_file))
+        except (json.JSONDecodeError, IOError):
+            pass
         
         # Update and save
         preferences[key] = value
         try:
             with open(user_file, 'w', encoding='utf-8') as f:
-                json.dump(preferences, f, indent=2)
+                f.write(json_dumps(preferences))
+            _json_cache[user_file] = (user_file.stat().st_mtime_ns, preferences)
         except IOError as e:
-            self.logger.error(f"Failed to save user preference: {e}")
+            logger.error(f"Failed to save user preference: {e}")
     
     def get_user_preference(self, key: str, default: Any = None) -> Any:
         """
@@ -242,23 +293,80 @@ class ConfigManager:
         """
         user_file = self.config_dir / "user.json"
         
-        if not user_file.exists():
-            return default
-        
         try:
-            with open(user_file, 'r', encoding='utf-8') as f:
-                preferences = json.load(f)
-                return preferences.get(key, default)
+            return _read_json_cached(user_file).get(key, default)
         except (json.JSONDecodeError, IOError):
             return default
 
 
+# Process-wide configuration, loaded on first get_config() call
+_CACHED_CONFIG: Optional[AppConfig] = None
+_CONFIG_LOCK = threading.Lock()
+
+# Shared manager behind the module-level functions, created on first use
+_default_manager: Optional[ConfigManager] = None
+
+
+def _mgr() -> ConfigManager:
+    """Get the shared ConfigManager for the default config directory."""
+    global _default_manager
+    
+    if _default_manager is None:
+        _default_manager = ConfigManager()
+    return _default_manager
+
+
 def get_config() -> AppConfig:
     """
     Convenience function to get application configuration.
     
+    The configuration is loaded once per process; later calls return the
+    same instance. Use invalidate_config() to force a reload.
+    
     Returns:
         Loaded AppConfig instance
     """
-    manager = ConfigManager()
-    return manager.load_config()
+    global _CACHED_CONFIG
+    
+    config = _CACHED_CONFIG
+    if config is None:
+        with _CONFIG_LOCK:
+            config = _CACHED_CONFIG
+            if config is None:
+                config = _mgr().load_config()
+                _CACHED_CONFIG = config
+    
+    return config
+
+
+def invalidate_config() -> None:
+    """Drop the cached configuration so the next get_config() reloads it."""
+    global _CACHED_CONFIG
+    
+    with _CONFIG_LOCK:
+        _CACHED_CONFIG = None
+
+
+def save_user_preference(key: str, value: Any) -> None:
+    """
+    Save user preference to the default user.json.
+    
+    Args:
+        key: Preference key
+        value: Preference value
+    """
+    _mgr().save_user_preference(key, value)
+
+
+def get_user_preference(key: str, default: Any = None) -> Any:
+    """
+    Get user preference from the default user.json.
+    
+    Args:
+        key: Preference key
+        default: Default value if key not found
+        
+    Returns:
+        Preference value or default
+    """
+    return _mgr().get_user_preference(key, default)
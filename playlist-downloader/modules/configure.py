@@ -10,49 +10,92 @@ for maximum download performance without overwhelming system resources.
 """
 
 import os
-import json
+import re
 import sys
+import importlib
+import functools
 from pathlib import Path
-from typing import Dict, Any, Tuple
-
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    print("⚠ Warning: psutil not installed. Using conservative defaults.")
-    print("For better system detection, install with: pip install psutil\n")
-
-try:
-    from modules.folder_selector import select_download_folder
-    FOLDER_SELECTOR_AVAILABLE = True
-except ImportError:
-    FOLDER_SELECTOR_AVAILABLE = False
-    print("⚠ Warning: folder_selector module not found. Will use default location.")
-
-try:
-    from modules.browser_auth import setup_browser_cookies, get_cookies_file
-    BROWSER_AUTH_AVAILABLE = True
-except ImportError:
-    BROWSER_AUTH_AVAILABLE = False
-    print("⚠ Warning: browser_auth module not found. Will skip browser login setup.")
+from types import ModuleType
+from typing import Dict, Any, NamedTuple, Optional
+
+from modules.utils import ensure_directory, json_dumps
 
 CONFIG_FILE = 'config.json'
 ENV_FILE = '.config/.env'
 
+# Working directory at startup (default downloads folder lives here)
+_CWD = Path.cwd()
+
+# Optional modules, imported on first use (module name -> module, or None if missing)
+_OPTIONAL_MODULES: Dict[str, Optional[ModuleType]] = {}
+
 
-def detect_resources() -> Tuple[int, float]:
+def _try_import(name: str, *warning: str) -> Optional[ModuleType]:
+    """
+    Import an optional module once, printing a warning if it is missing.
+    
+    Args:
+        name: Module name to import
+        warning: Lines to print if the import fails
+        
+    Returns:
+        The imported module, or None if it isn't available
+    """
+    if name not in _OPTIONAL_MODULES:
+        try:
+            _OPTIONAL_MODULES[name] = importlib.import_module(name)
+        except ImportError:
+            _OPTIONAL_MODULES[name] = None
+            print("\n".join(warning))
+    return _OPTIONAL_MODULES[name]
+
+
+def _try_import_psutil() -> Optional[ModuleType]:
+    """Get psutil if installed (used for memory detection)."""
+    return _try_import(
+        'psutil',
+        "⚠ Warning: psutil not installed. Using conservative defaults.",
+        "For better system detection, install with: pip install psutil\n"
+    )
+
+
+def _try_import_folder_selector() -> Optional[ModuleType]:
+    """Get the folder_selector module if available."""
+    return _try_import(
+        'modules.folder_selector',
+        "⚠ Warning: folder_selector module not found. Will use default location."
+    )
+
+
+def _try_import_browser_auth() -> Optional[ModuleType]:
+    """Get the browser_auth module if available."""
+    return _try_import(
+        'modules.browser_auth',
+        "⚠ Warning: browser_auth module not found. Will skip browser login setup."
+    )
+
+
+class Resources(NamedTuple):
+    """Detected system resources."""
+    cpu_cores: int
+    total_mem_gb: float
+
+
+@functools.lru_cache(maxsize=1)
+def detect_resources() -> Resources:
     """
     Detect system CPU and memory resources.
+    The result is cached for the lifetime of the process.
     
     Returns:
-        Tuple of (cpu_cores, total_mem_gb)
+        Resources tuple of (cpu_cores, total_mem_gb)
     """
     # CPU detection - works on all platforms
     cpu_cores = os.cpu_count() or 1
     
     # Memory detection - requires psutil
-    if PSUTIL_AVAILABLE:
+    psutil = _try_import_psutil()
+    if psutil:
         try:
             virtual_mem = psutil.virtual_memory()
             total_mem_gb = virtual_mem.total / (1024 ** 3)  # Convert to GB
@@ -63,7 +106,7 @@ def detect_resources() -> Tuple[int, float]:
         # Conservative default if psutil not available
         total_mem_gb = 4.0
     
-    return cpu_cores, total_mem_gb
+    return Resources(cpu_cores, total_mem_gb)
 
 
 def recommend_settings(cpu_cores: int, total_mem_gb: float) -> Dict[str, Any]:
@@ -132,12 +175,17 @@ def create_config_directory() -> Path:
     """
     config_dir = Path('.config')
     if not config_dir.exists():
-        config_dir.mkdir(parents=True, exist_ok=True)
+        ensure_directory(config_dir)
         print(f"✓ Created configuration directory: {config_dir}")
     return config_dir
 
 
-def setup_download_location() -> str:
+def _norm(path: str) -> Path:
+    """Expand ~ and make a user-supplied path absolute."""
+    return Path(path).expanduser().resolve()
+
+
+def setup_download_location() -> Path:
     """
     Interactive setup for download location.
     Allows users to browse and select or create a folder.
@@ -153,18 +201,13 @@ def setup_download_location() -> str:
     print()
     
     # Check if download location already configured
-    env_path = Path(ENV_FILE)
-    existing_location = None
+    from dotenv import dotenv_values
     
-    if env_path.exists():
-        try:
-            with open(env_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('OUTPUT_DIR='):
-                        existing_location = line.split('=', 1)[1].strip().strip('"\'')
-                        break
-        except Exception:
-            pass
+    existing_location = None
+    try:
+        existing_location = dotenv_values(ENV_FILE).get('OUTPUT_DIR')
+    except Exception:
+        pass
     
     if existing_location and os.path.exists(existing_location):
         print(f"Current download location: {existing_location}")
@@ -174,13 +217,14 @@ def setup_download_location() -> str:
         response = input("Keep this location? (y/n) [y]: ").strip().lower()
         if response != 'n':
             print(f"✓ Using existing location: {existing_location}")
-            return existing_location
+            return Path(existing_location)
         print()
     
     # Select new location
     download_folder = None
     
-    if FOLDER_SELECTOR_AVAILABLE:
+    folder_selector = _try_import_folder_selector()
+    if folder_selector:
         # Try GUI first for better user experience
         print("Would you like to use:")
         print("  1. Graphical folder browser (recommended for beginners)")
@@ -191,10 +235,13 @@ def setup_download_location() -> str:
         
         if choice == "2":
             # CLI selection
-            download_folder = select_download_folder(use_gui=False)
+            selected = folder_selector.select_download_folder(use_gui=False)
         else:
             # Try GUI, fall back to CLI if it fails
-            download_folder = select_download_folder(use_gui=True)
+            selected = folder_selector.select_download_folder(use_gui=True)
+        
+        if selected:
+            download_folder = Path(selected)
     else:
         # Fallback: simple input
         print("Available options:")
@@ -205,12 +252,10 @@ def setup_download_location() -> str:
         choice = input("Choose option (1/2) [1]: ").strip()
         
         if choice == "2":
-            custom_path = input("Enter full path for downloads: ").strip()
-            custom_path = os.path.expanduser(custom_path)
-            custom_path = os.path.abspath(custom_path)
+            custom_path = _norm(input("Enter full path for downloads: ").strip())
             
             try:
-                os.makedirs(custom_path, exist_ok=True)
+                custom_path.mkdir(parents=True, exist_ok=True)
                 print(f"✓ Created/using folder: {custom_path}")
                 download_folder = custom_path
             except Exception as e:
@@ -220,14 +265,14 @@ def setup_download_location() -> str:
         
         if not download_folder:
             # Use default
-            download_folder = os.path.join(os.getcwd(), 'downloads')
-            os.makedirs(download_folder, exist_ok=True)
+            download_folder = _CWD / 'downloads'
+            ensure_directory(download_folder)
             print(f"✓ Using default location: {download_folder}")
     
     if not download_folder:
         # Last resort fallback
-        download_folder = os.path.join(os.getcwd(), 'downloads')
-        os.makedirs(download_folder, exist_ok=True)
+        download_folder = _CWD / 'downloads'
+        ensure_directory(download_folder)
         print(f"✓ Using default location: {download_folder}")
     
     print()
@@ -237,46 +282,66 @@ def setup_download_location() -> str:
     return download_folder
 
 
-def save_download_location_to_env(download_folder: str) -> None:
+def update_env_vars(env_path: Path, updates: Dict[str, str]) -> bool:
     """
-    Save download location to .env file.
-    Creates or updates OUTPUT_DIR in .env file.
+    Create or update several variables in a .env file.
+    The file is read once and written once; other lines are kept as-is.
     
     Args:
-        download_folder: Path to download folder
+        env_path: Path to .env file
+        updates: Mapping of variable name to new value
+    
+    Returns:
+        True if the file was written, False otherwise
     """
-    env_path = Path(ENV_FILE)
-    env_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_directory(env_path.parent)
     
-    # Read existing .env content
+    # Read existing .env content, replacing matching lines in place
     env_lines = []
-    output_dir_exists = False
+    remaining = dict(updates)
+    key_pattern = re.compile('^(' + '|'.join(re.escape(key) for key in updates) + ')=')
     
     if env_path.exists():
         try:
             with open(env_path, 'r', encoding='utf-8') as f:
                 for line in f:
-                    if line.startswith('OUTPUT_DIR='):
-                        env_lines.append(f'OUTPUT_DIR="{download_folder}"\n')
-                        output_dir_exists = True
+                    match = key_pattern.match(line)
+                    if match and match.group(1) in remaining:
+                        key = match.group(1)
+                        env_lines.append(f'{key}="{remaining.pop(key)}"\n')
                     else:
                         env_lines.append(line)
         except Exception as e:
             print(f"Warning: Could not read existing .env: {e}")
     
-    # Add OUTPUT_DIR if it doesn't exist
-    if not output_dir_exists:
-        env_lines.append(f'OUTPUT_DIR="{download_folder}"\n')
+    # Add variables that weren't in the file yet
+    if env_lines and not env_lines[-1].endswith('\n'):
+        env_lines[-1] += '\n'
+    env_lines.extend(f'{key}="{value}"\n' for key, value in remaining.items())
     
     # Write back to .env
     try:
         with open(env_path, 'w', encoding='utf-8') as f:
             f.writelines(env_lines)
-        print(f"✓ Saved download location to {ENV_FILE}")
+        return True
     except Exception as e:
         print(f"✗ Error saving to .env: {e}")
-        print(f"Please manually add this line to {ENV_FILE}:")
-        print(f'OUTPUT_DIR="{download_folder}"')
+        print(f"Please manually add these lines to {env_path}:")
+        for key, value in updates.items():
+            print(f'{key}="{value}"')
+        return False
+
+
+def save_download_location_to_env(download_folder: Path) -> None:
+    """
+    Save download location to .env file.
+    Creates or updates OUTPUT_DIR in .env file.
+    
+    Args:
+        download_folder: Path to download folder
+    """
+    if update_env_vars(Path(ENV_FILE), {'OUTPUT_DIR': str(download_folder)}):
+        print(f"✓ Saved download location to {ENV_FILE}")
 
 
 def save_cookies_path_to_env(cookies_file: str) -> None:
@@ -287,36 +352,8 @@ def save_cookies_path_to_env(cookies_file: str) -> None:
     Args:
         cookies_file: Path to cookies file
     """
-    env_path = Path(ENV_FILE)
-    env_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Read existing .env content
-    env_lines = []
-    cookies_exists = False
-    
-    if env_path.exists():
-        try:
-            with open(env_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('YOUTUBE_COOKIES='):
-                        env_lines.append(f'YOUTUBE_COOKIES="{cookies_file}"\n')
-                        cookies_exists = True
-                    else:
-                        env_lines.append(line)
-        except Exception as e:
-            print(f"Warning: Could not read existing .env: {e}")
-    
-    # Add YOUTUBE_COOKIES if it doesn't exist
-    if not cookies_exists:
-        env_lines.append(f'YOUTUBE_COOKIES="{cookies_file}"\n')
-    
-    # Write back to .env
-    try:
-        with open(env_path, 'w', encoding='utf-8') as f:
-            f.writelines(env_lines)
+    if update_env_vars(Path(ENV_FILE), {'YOUTUBE_COOKIES': cookies_file}):
         print(f"✓ Saved YouTube cookies path to {ENV_FILE}")
-    except Exception as e:
-        print(f"✗ Error saving cookies path to .env: {e}")
 
 
 def validate_settings(settings: Dict[str, Any]) -> bool:
@@ -371,8 +408,9 @@ def main() -> int:
         # Step 2: Browser login for YouTube access
         print("\n[Step 2/4] Browser Login Setup (Optional)")
         cookies_file = None
-        if BROWSER_AUTH_AVAILABLE:
-            cookies_file = setup_browser_cookies()
+        browser_auth = _try_import_browser_auth()
+        if browser_auth:
+            cookies_file = browser_auth.setup_browser_cookies()
             if cookies_file:
                 # Save cookies path to .env
                 print(f"✓ Browser login configured")
@@ -404,18 +442,18 @@ def main() -> int:
         # Create config directory if needed
         create_config_directory()
         
-        # Save download location to .env
-        save_download_location_to_env(download_folder)
-        
-        # Save cookies path to .env if available
+        # Save download location (and cookies path if available) to .env
+        env_updates = {'OUTPUT_DIR': str(download_folder)}
         if cookies_file:
-            save_cookies_path_to_env(cookies_file)
+            env_updates['YOUTUBE_COOKIES'] = cookies_file
+        if update_env_vars(Path(ENV_FILE), env_updates):
+            print(f"✓ Saved settings to {ENV_FILE}")
         
         # Write config file
         config_path = Path(CONFIG_FILE)
         try:
             with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
+                f.write(json_dumps(settings))
             print(f"✓ System configuration saved to {CONFIG_FILE}")
             print()
         except (IOError, OSError) as e:
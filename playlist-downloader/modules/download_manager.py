@@ -8,21 +8,32 @@ rate limiting, and concurrent execution.
 import asyncio
 import logging
 import os
-from typing import Optional, List, Dict, Callable
+import random
+import threading
+from concurrent.futures import Executor
+from typing import Optional, List, Dict, Callable, Iterator, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
-from modules.utils import simplify_search_query
+try:
+    import yt_dlp
+    YT_DLP_AVAILABLE = True
+except ImportError:
+    # Only the yt-dlp executable is installed; fall back to the CLI
+    YT_DLP_AVAILABLE = False
 
+from modules.search_cache import SearchCache
+from modules.utils import TokenBucket, simplify_search_query
 
-class DownloadStatus(Enum):
-    """Download status enumeration."""
-    PENDING = "pending"
-    SEARCHING = "searching"
-    DOWNLOADING = "downloading"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+
+class DownloadStatus(IntEnum):
+    """Download status enumeration (use .name for display)."""
+    PENDING = 0
+    SEARCHING = 1
+    DOWNLOADING = 2
+    COMPLETED = 3
+    FAILED = 4
+    SKIPPED = 5
 
 
 @dataclass
@@ -37,11 +48,14 @@ class DownloadJob:
     status: DownloadStatus = DownloadStatus.PENDING
     error_message: Optional[str] = None
     retries: int = 0
+    output_template: Optional[str] = None
     
     def __post_init__(self):
-        """Initialize search query if not provided."""
+        """Initialize search query and yt-dlp output template if not provided."""
         if not self.search_query:
             self.search_query = simplify_search_query(self.track_name, self.artist)
+        if not self.output_template:
+            self.output_template = os.path.join(self.output_dir, f"{self.filename}.%(ext)s")
 
 
 @dataclass
@@ -53,30 +67,95 @@ class DownloadResult:
     error: Optional[str] = None
 
 
+def backoff_delay(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+    rng: Optional[random.Random] = None
+) -> float:
+    """
+    Exponential backoff delay with an upper bound and random jitter.
+    
+    The jitter keeps concurrent workers that failed together from all
+    retrying at the same moment.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay for the first retry in seconds
+        cap: Maximum delay before jitter in seconds
+        jitter: Maximum extra fraction of the delay added at random
+        rng: Random generator to draw the jitter from (default: module-level)
+        
+    Returns:
+        Delay in seconds
+    """
+    return min(cap, base * 2 ** attempt) * (1 + (rng or random).random() * jitter)
+
+
+def is_rate_limited(stderr: str) -> bool:
+    """Check yt-dlp error output for an HTTP 429 response."""
+    return 'HTTP Error 429' in stderr or 'Too Many Requests' in stderr
+
+
+class RateLimitedError(Exception):
+    """Raised when YouTube answers a search with HTTP 429."""
+
+
+# Initial download buffer (yt-dlp starts at 1 KiB and grows it); a larger
+# start means fewer, bigger write() calls for the first part of each file
+DOWNLOAD_BUFFER_SIZE = 64 * 1024
+
+# User agent sent with searches to appear more like a browser
+SEARCH_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
 class YouTubeSearcher:
     """Handles YouTube search operations with rate limiting."""
     
     def __init__(
         self,
-        delay_min: float = 0.5,
-        delay_max: float = 1.5,
+        rate_limit: float = 10.0,
         max_retries: int = 3,
-        cookies_file: Optional[str] = None
+        cookies_file: Optional[str] = None,
+        cache: Optional[SearchCache] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize YouTube searcher.
         
         Args:
-            delay_min: Minimum delay between searches (seconds)
-            delay_max: Maximum delay between searches (seconds)
+            rate_limit: Maximum searches per second (lowered automatically on HTTP 429)
             max_retries: Maximum number of retry attempts
             cookies_file: Path to cookies file for authenticated access
+            cache: Persistent cache of previous search results (optional)
+            executor: Thread pool for in-process searches (default: the loop's executor)
         """
-        self.delay_min = delay_min
-        self.delay_max = delay_max
+        self.rate_limiter = TokenBucket(rate_limit)
         self.max_retries = max_retries
         self.cookies_file = cookies_file
+        self.cache = cache
+        self.executor = executor
         self.logger = logging.getLogger(__name__)
+        
+        # Checked once; the cookies file doesn't appear or vanish mid-run
+        self._cookies_ok = bool(cookies_file) and os.path.exists(cookies_file)
+        self._rng = random.Random()
+        
+        # One YoutubeDL per executor thread, reused across searches so its
+        # HTTP connections stay open (keep-alive) between queries
+        self._local = threading.local()
+        self._ydls: List = []
+        self.ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+            # Only list the search results, don't resolve each video
+            'extract_flat': 'in_playlist',
+            'http_headers': {'User-Agent': SEARCH_USER_AGENT},
+        }
+        if self._cookies_ok:
+            self.ydl_opts['cookiefile'] = self.cookies_file
     
     async def search(self, query: str) -> Optional[str]:
         """
@@ -88,51 +167,151 @@ class YouTubeSearcher:
         Returns:
             YouTube video URL or None if not found
         """
+        if self.cache:
+            cached_url = self.cache.get(query)
+            if cached_url:
+                self.logger.debug(f"Cache hit for '{query}': {cached_url}")
+                return cached_url
+            if self.cache.is_not_found(query):
+                self.logger.debug(f"Skipping '{query}': no results on a recent search")
+                return None
+        
+        url, not_found = await self._search_youtube(query)
+        
+        if self.cache:
+            if url:
+                self.cache.set(query, url)
+            elif not_found:
+                self.cache.set_not_found(query)
+        
+        return url
+    
+    def close(self) -> None:
+        """Close the per-thread YoutubeDL instances and their connections."""
+        for ydl in self._ydls:
+            ydl.close()
+        self._ydls.clear()
+    
+    def _search_in_process(self, query: str) -> Optional[str]:
+        """
+        Search using the yt_dlp Python API (blocking, run in an executor).
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            YouTube video ID or None if not found
+            
+        Raises:
+            RateLimitedError: If YouTube responded with HTTP 429
+        """
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+            self._ydls.append(ydl)
+        
+        try:
+            info = ydl.extract_info(f"ytsearch1:{query}", download=False)
+        except yt_dlp.utils.DownloadError as e:
+            if is_rate_limited(str(e)):
+                raise RateLimitedError(str(e)) from e
+            raise
+        
+        entries = (info or {}).get('entries') or []
+        return entries[0].get('id') if entries else None
+    
+    async def _search_subprocess(self, query: str) -> Optional[str]:
+        """
+        Search by spawning the yt-dlp CLI.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            YouTube video ID or None if not found
+            
+        Raises:
+            RateLimitedError: If YouTube responded with HTTP 429
+            RuntimeError: If yt-dlp failed for any other reason
+        """
+        cmd = [
+            "yt-dlp",
+            f"ytsearch1:{query}",
+            "--get-id",
+            "--skip-download",
+            "--no-warnings",
+            "--user-agent", SEARCH_USER_AGENT,
+        ]
+        
+        # Add cookies if available
+        if self._cookies_ok:
+            cmd.extend(["--cookies", self.cookies_file])
+        
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        stdout, stderr = await proc.communicate()
+        
+        if proc.returncode == 0:
+            return stdout.decode().strip() or None
+        error = stderr.decode(errors='replace')
+        if is_rate_limited(error):
+            raise RateLimitedError(f"yt-dlp exited with {proc.returncode}")
+        raise RuntimeError(f"yt-dlp exited with {proc.returncode}: {error.strip()[-200:]}")
+    
+    async def _search_youtube(self, query: str) -> Tuple[Optional[str], bool]:
+        """
+        Run the yt-dlp search with retries.
+        
+        Uses the in-process yt_dlp API when the package is importable,
+        otherwise falls back to the yt-dlp CLI.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Tuple of (YouTube video URL or None, whether the search
+            completed without error and found nothing)
+        """
+        loop = asyncio.get_running_loop()
+        
         for attempt in range(self.max_retries):
             try:
-                cmd = [
-                    "yt-dlp",
-                    f"ytsearch1:{query}",
-                    "--get-id",
-                    "--skip-download",
-                    "--no-warnings",
-                    # Add user agent to appear more like a browser
-                    "--user-agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                ]
-                
-                # Add cookies if available
-                if self.cookies_file and os.path.exists(self.cookies_file):
-                    cmd.extend(["--cookies", self.cookies_file])
+                await self.rate_limiter.acquire_async()
                 
-                proc = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
+                if YT_DLP_AVAILABLE:
+                    video_id = await loop.run_in_executor(
+                        self.executor, self._search_in_process, query
+                    )
+                else:
+                    video_id = await self._search_subprocess(query)
                 
-                stdout, stderr = await proc.communicate()
+                if video_id:
+                    self.logger.debug(f"Found video for '{query}': {video_id}")
+                    return f"https://www.youtube.com/watch?v={video_id}", False
                 
-                if proc.returncode == 0:
-                    video_id = stdout.decode().strip()
-                    if video_id:
-                        self.logger.debug(f"Found video for '{query}': {video_id}")
-                        # Add random delay to avoid rate limiting
-                        import random
-                        delay = random.uniform(self.delay_min, self.delay_max)
-                        await asyncio.sleep(delay)
-                        return f"https://www.youtube.com/watch?v={video_id}"
+                # A clean empty result won't change on retry
+                self.logger.debug(f"No video found for '{query}'")
+                return None, True
                 
-                # Rate limiting delay with randomization
-                import random
-                delay = random.uniform(self.delay_min, self.delay_max)
-                await asyncio.sleep(delay)
+            except RateLimitedError:
+                # Only back off when YouTube actually pushes back
+                self.rate_limiter.slow_down()
+                self.logger.warning(
+                    f"Rate limited by YouTube, lowering search rate to "
+                    f"{self.rate_limiter.rate:g}/s"
+                )
+                await asyncio.sleep(backoff_delay(attempt, rng=self._rng))
                 
             except Exception as e:
                 self.logger.warning(f"Search attempt {attempt + 1} failed for '{query}': {e}")
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                await asyncio.sleep(backoff_delay(attempt, rng=self._rng))
         
         self.logger.error(f"Failed to find video after {self.max_retries} attempts: {query}")
-        return None
+        return None, False
 
 
 class YouTubeDownloader:
@@ -143,7 +322,8 @@ class YouTubeDownloader:
         audio_format: str = "best",
         audio_quality: str = "320K",
         max_retries: int = 3,
-        cookies_file: Optional[str] = None
+        cookies_file: Optional[str] = None,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize YouTube downloader.
@@ -153,17 +333,116 @@ class YouTubeDownloader:
             audio_quality: Audio quality (128K, 192K, 256K, 320K)
             max_retries: Maximum number of retry attempts
             cookies_file: Path to cookies file for authenticated access
+            executor: Thread pool for in-process downloads (default: the loop's executor)
         """
         self.audio_format = audio_format
         self.audio_quality = audio_quality
         self.max_retries = max_retries
         self.cookies_file = cookies_file
+        self.executor = executor
         self.logger = logging.getLogger(__name__)
+        self._cookies_ok = bool(cookies_file) and os.path.exists(cookies_file)
+        self._rng = random.Random()
+        
+        # yt-dlp options equivalent to the CLI flags used by _download_subprocess
+        self.ydl_opts = {
+            'format': "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best",
+            'postprocessors': [
+                {
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': self.audio_format,
+                    'preferredquality': self.audio_quality.rstrip('kK'),
+                },
+                {'key': 'FFmpegMetadata', 'add_metadata': True},
+            ],
+            'noplaylist': True,
+            'updatetime': False,
+            'no_warnings': True,
+            'quiet': True,
+            'noprogress': True,
+            'retries': 10,
+            'fragment_retries': 10,
+            'buffersize': DOWNLOAD_BUFFER_SIZE,
+            'geo_bypass': True,
+            'age_limit': 21,
+        }
+        if self._cookies_ok:
+            self.ydl_opts['cookiefile'] = self.cookies_file
+        
+        # Static part of the CLI command used by _download_subprocess
+        self._base_cmd = (
+            "yt-dlp",
+            "--extract-audio",
+            "--audio-format", self.audio_format,
+            "--audio-quality", self.audio_quality,
+            "--format", "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best",
+            "--no-playlist",
+            "--embed-metadata",
+            "--add-metadata",
+            "--no-mtime",
+            "--no-warnings",
+            "--quiet",
+            "--retries", "10",
+            "--fragment-retries", "10",
+            "--buffer-size", str(DOWNLOAD_BUFFER_SIZE),
+            "--geo-bypass",
+            "--age-limit", "21",
+        )
+        self._cookie_args = ("--cookies", self.cookies_file) if self._cookies_ok else ()
+    
+    def _download_in_process(self, url: str, output_template: str) -> bool:
+        """
+        Download using the yt_dlp Python API (blocking, run in an executor).
+        
+        Args:
+            url: YouTube video URL
+            output_template: Output file path template (including %(ext)s)
+            
+        Returns:
+            True if download successful, False otherwise
+        """
+        with yt_dlp.YoutubeDL({**self.ydl_opts, 'outtmpl': output_template}) as ydl:
+            return ydl.download([url]) == 0
+    
+    async def _download_subprocess(self, url: str, output_template: str) -> bool:
+        """
+        Download by spawning the yt-dlp CLI.
+        
+        One process per URL on purpose: each job has its own output file
+        name (from the Spotify track, not the video title), which a single
+        `yt-dlp -a -` batch with one --output template can't express. This
+        path is only the fallback when the yt_dlp package isn't importable.
+        
+        Args:
+            url: YouTube video URL
+            output_template: Output file path template (including %(ext)s)
+            
+        Returns:
+            True if download successful, False otherwise
+        """
+        cmd = (*self._base_cmd, "--output", output_template, *self._cookie_args, url)
+        
+        # Only stderr is used, and only when the download failed
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        _, stderr = await proc.communicate()
+        
+        if proc.returncode != 0:
+            self.logger.warning(f"yt-dlp exited with {proc.returncode}: {stderr.decode(errors='replace')}")
+            return False
+        return True
     
     async def download(self, url: str, output_template: str) -> bool:
         """
         Download audio from YouTube URL.
         
+        Uses the in-process yt_dlp API when the package is importable,
+        otherwise falls back to the yt-dlp CLI.
+        
         Args:
             url: YouTube video URL
             output_template: Output file path template (including %(ext)s)
@@ -171,53 +450,28 @@ class YouTubeDownloader:
         Returns:
             True if download successful, False otherwise
         """
+        loop = asyncio.get_running_loop()
+        
         for attempt in range(self.max_retries):
             try:
-                cmd = [
-                    "yt-dlp",
-                    "--extract-audio",
-                    "--audio-format", self.audio_format,
-                    "--audio-quality", self.audio_quality,
-                    "--format", "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best",
-                    "--output", output_template,
-                    "--no-playlist",
-                    "--embed-metadata",
-                    "--add-metadata",
-                    "--no-mtime",
-                    "--no-warnings",
-                    "--quiet",
-                    "--retries", "10",
-                    "--fragment-retries", "10",
-                    "--geo-bypass",
-                    "--age-limit", "21",
-                ]
-                
-                # Add cookies if available
-                if self.cookies_file and os.path.exists(self.cookies_file):
-                    cmd.extend(["--cookies", self.cookies_file])
-                
-                cmd.append(url)
-                
-                proc = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                
-                stdout, stderr = await proc.communicate()
+                if YT_DLP_AVAILABLE:
+                    success = await loop.run_in_executor(
+                        self.executor, self._download_in_process, url, output_template
+                    )
+                else:
+                    success = await self._download_subprocess(url, output_template)
                 
-                if proc.returncode == 0:
+                if success:
                     self.logger.debug(f"Successfully downloaded: {url}")
                     return True
                 else:
-                    self.logger.warning(f"Download attempt {attempt + 1} failed: {stderr.decode()}")
+                    self.logger.warning(f"Download attempt {attempt + 1} failed: {url}")
                 
-                # Exponential backoff
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(backoff_delay(attempt, rng=self._rng))
                 
             except Exception as e:
                 self.logger.warning(f"Download attempt {attempt + 1} exception: {e}")
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(backoff_delay(attempt, rng=self._rng))
         
         self.logger.error(f"Failed to download after {self.max_retries} attempts: {url}")
         return False
@@ -225,7 +479,11 @@ class YouTubeDownloader:
 
 class DownloadManager:
     """
-    Manages concurrent download operations with search and download workers.
+    Manages concurrent download operations.
+    
+    A fixed set of runner tasks takes jobs from a shared iterator; each
+    job searches (if needed) and then downloads, with separate semaphores
+    bounding how many searches and downloads are in flight at once.
     """
     
     def __init__(
@@ -242,9 +500,9 @@ class DownloadManager:
         Args:
             searcher: YouTubeSearcher instance
             downloader: YouTubeDownloader instance
-            search_workers: Number of concurrent search workers
-            download_workers: Number of concurrent download workers
-            progress_callback: Optional callback for progress updates (status, completed, total)
+            search_workers: Maximum number of concurrent searches
+            download_workers: Maximum number of concurrent downloads
+            progress_callback: Optional callback for progress updates (status, finished, total)
         """
         self.searcher = searcher
         self.downloader = downloader
@@ -253,88 +511,168 @@ class DownloadManager:
         self.progress_callback = progress_callback
         self.logger = logging.getLogger(__name__)
         
-        # Queues for work distribution
-        self.search_queue: asyncio.Queue = asyncio.Queue()
-        self.download_queue: asyncio.Queue = asyncio.Queue()
-        
         # Results storage
         self.results: List[DownloadResult] = []
         self.failed_searches: List[DownloadJob] = []
+        self.total_jobs = 0
+        self.completed_count = 0
+        self.failed_count = 0
+        self.searches: Dict[str, asyncio.Future] = {}
     
-    async def _search_worker(self):
-        """Worker coroutine for searching YouTube."""
-        while True:
-            job = await self.search_queue.get()
+    def _report_progress(self, status: str) -> None:
+        """
+        Tell the progress callback that one more job has finished.
+        
+        Failed searches and downloads count as finished too, so the
+        reported count always reaches total_jobs (fixed when processing
+        starts) at the end of the run.
+        
+        Args:
+            status: What happened to the job (downloaded, failed, search_failed)
+        """
+        if self.progress_callback:
+            finished = self.completed_count + self.failed_count + len(self.failed_searches)
+            self.progress_callback(status, finished, self.total_jobs)
+    
+    async def _run_search(self, query: str, search_sem: asyncio.Semaphore) -> Optional[str]:
+        """Run one YouTube search under the search semaphore."""
+        async with search_sem:
+            return await self.searcher.search(query)
+    
+    def _shared_search(self, query: str, search_sem: asyncio.Semaphore) -> asyncio.Future:
+        """
+        Get the search for a query, starting it only if no job has yet.
+        
+        The same song in several playlists produces several jobs with the
+        same query; they all await one search and share its URL.
+        
+        Args:
+            query: Search query string
+            search_sem: Semaphore bounding concurrent searches
             
-            if job is None:  # Sentinel value to stop worker
-                self.search_queue.task_done()
-                break
+        Returns:
+            Future resolving to the YouTube URL or None
+        """
+        key = query.lower()
+        search = self.searches.get(key)
+        if search is None:
+            search = asyncio.ensure_future(self._run_search(query, search_sem))
+            self.searches[key] = search
+        return search
+    
+    async def _search(self, job: DownloadJob, search_sem: asyncio.Semaphore) -> bool:
+        """
+        Resolve a YouTube URL for a job.
+        
+        Args:
+            job: DownloadJob without a youtube_url
+            search_sem: Semaphore bounding concurrent searches
             
-            try:
-                job.status = DownloadStatus.SEARCHING
-                url = await self.searcher.search(job.search_query)
-                
-                if url:
-                    job.youtube_url = url
-                    await self.download_queue.put(job)
-                else:
-                    job.status = DownloadStatus.FAILED
-                    job.error_message = "YouTube video not found"
-                    self.failed_searches.append(job)
-                    
-            except Exception as e:
-                self.logger.error(f"Search worker exception for {job.track_name}: {e}")
-                job.status = DownloadStatus.FAILED
-                job.error_message = str(e)
-                self.failed_searches.append(job)
+        Returns:
+            True if a URL was found, False otherwise
+        """
+        try:
+            job.status = DownloadStatus.SEARCHING
+            url = await self._shared_search(job.search_query, search_sem)
+            
+            if url:
+                job.youtube_url = url
+                return True
             
-            finally:
-                self.search_queue.task_done()
+            job.status = DownloadStatus.FAILED
+            job.error_message = "YouTube video not found"
+                
+        except Exception as e:
+            self.logger.error(f"Search exception for {job.track_name}: {e}")
+            job.status = DownloadStatus.FAILED
+            job.error_message = str(e)
+        
+        self.failed_searches.append(job)
+        self._report_progress("search_failed")
+        return False
     
-    async def _download_worker(self):
-        """Worker coroutine for downloading from YouTube."""
-        while True:
-            job = await self.download_queue.get()
+    async def _download(self, job: DownloadJob) -> None:
+        """
+        Download a job whose YouTube URL is known and record the result.
+        
+        Args:
+            job: DownloadJob with a youtube_url
+        """
+        try:
+            job.status = DownloadStatus.DOWNLOADING
             
-            if job is None:  # Sentinel value to stop worker
-                self.download_queue.task_done()
-                break
+            if not job.youtube_url:
+                raise ValueError("No YouTube URL provided for download")
             
-            try:
-                job.status = DownloadStatus.DOWNLOADING
-                
-                if not job.youtube_url:
-                    raise ValueError("No YouTube URL provided for download")
-                
-                import os
-                output_template = os.path.join(job.output_dir, f"{job.filename}.%(ext)s")
-                success = await self.downloader.download(job.youtube_url, output_template)
-                
-                if success:
-                    job.status = DownloadStatus.COMPLETED
-                    result = DownloadResult(job=job, success=True, output_path=output_template)
-                else:
-                    job.status = DownloadStatus.FAILED
-                    job.error_message = "Download failed after retries"
-                    result = DownloadResult(job=job, success=False, error="Download failed")
-                
-                self.results.append(result)
+            success = await self.downloader.download(job.youtube_url, job.output_template)
+            
+            if success:
+                job.status = DownloadStatus.COMPLETED
+                result = DownloadResult(job=job, success=True, output_path=job.output_template)
+            else:
+                job.status = DownloadStatus.FAILED
+                job.error_message = "Download failed after retries"
+                result = DownloadResult(job=job, success=False, error="Download failed")
+            
+            self.results.append(result)
+            
+            # Update progress
+            if success:
+                self.completed_count += 1
+                self._report_progress("downloaded")
+            else:
+                self.failed_count += 1
+                self._report_progress("failed")
                 
-                # Update progress
-                if self.progress_callback:
-                    completed = sum(1 for r in self.results if r.success)
-                    total = len(self.results) + self.search_queue.qsize() + self.download_queue.qsize()
-                    self.progress_callback("downloaded", completed, total)
-                    
+        except Exception as e:
+            self.logger.error(f"Download exception for {job.track_name}: {e}")
+            job.status = DownloadStatus.FAILED
+            job.error_message = str(e)
+            result = DownloadResult(job=job, success=False, error=str(e))
+            self.results.append(result)
+            self.failed_count += 1
+            self._report_progress("failed")
+    
+    async def _process_job(
+        self,
+        job: DownloadJob,
+        search_sem: asyncio.Semaphore,
+        download_sem: asyncio.Semaphore
+    ) -> None:
+        """Search (unless the job has a direct URL) and then download one job."""
+        # Jobs with direct YouTube URLs skip search
+        if not job.youtube_url and not await self._search(job, search_sem):
+            return
+        
+        async with download_sem:
+            await self._download(job)
+    
+    async def _run_jobs(
+        self,
+        pending: Iterator[DownloadJob],
+        search_sem: asyncio.Semaphore,
+        download_sem: asyncio.Semaphore
+    ) -> None:
+        """
+        Take jobs from a shared iterator and process them one at a time.
+        
+        Args:
+            pending: Iterator of jobs shared by all runners
+            search_sem: Semaphore bounding concurrent searches
+            download_sem: Semaphore bounding concurrent downloads
+        """
+        for job in pending:
+            try:
+                await self._process_job(job, search_sem, download_sem)
             except Exception as e:
-                self.logger.error(f"Download worker exception for {job.track_name}: {e}")
+                # _search/_download handle their own errors; anything that
+                # still escaped must not stop this runner's other jobs
+                self.logger.error(f"Unexpected error for {job.track_name}: {e}")
                 job.status = DownloadStatus.FAILED
                 job.error_message = str(e)
-                result = DownloadResult(job=job, success=False, error=str(e))
-                self.results.append(result)
-            
-            finally:
-                self.download_queue.task_done()
+                self.results.append(DownloadResult(job=job, success=False, error=str(e)))
+                self.failed_count += 1
+                self._report_progress("failed")
     
     async def process_jobs(self, jobs: List[DownloadJob]) -> Dict[str, List[DownloadResult]]:
         """
@@ -348,42 +686,27 @@ class DownloadManager:
         """
         self.results = []
         self.failed_searches = []
+        self.total_jobs = len(jobs)
+        self.completed_count = 0
+        self.failed_count = 0
+        self.searches = {}
         
-        # Start workers
-        search_tasks = [
-            asyncio.create_task(self._search_worker())
-            for _ in range(self.search_workers)
-        ]
-        
-        download_tasks = [
-            asyncio.create_task(self._download_worker())
-            for _ in range(self.download_workers)
-        ]
-        
-        # Queue jobs
-        for job in jobs:
-            # Jobs with direct YouTube URLs skip search
-            if job.youtube_url:
-                await self.download_queue.put(job)
-            else:
-                await self.search_queue.put(job)
-        
-        # Send sentinel values to stop workers
-        for _ in range(self.search_workers):
-            await self.search_queue.put(None)
-        
-        # Wait for all searches to complete
-        await self.search_queue.join()
-        
-        # Send sentinel values to download workers
-        for _ in range(self.download_workers):
-            await self.download_queue.put(None)
+        search_sem = asyncio.BoundedSemaphore(self.search_workers)
+        download_sem = asyncio.BoundedSemaphore(self.download_workers)
         
-        # Wait for all downloads to complete
-        await self.download_queue.join()
+        # Enough runners for the in-flight searches, the downloads, and up to
+        # 4 resolved jobs waiting per download slot. A fixed runner count
+        # keeps the number of tasks constant however long the playlist is,
+        # and caps how far searches run ahead of downloads.
+        runners = min(len(jobs), self.search_workers + self.download_workers * 5)
+        pending = iter(jobs)
         
-        # Wait for all workers to finish
-        await asyncio.gather(*search_tasks, *download_tasks)
+        # Each runner searches then downloads as soon as it can, so the two
+        # stages overlap instead of waiting on each other
+        await asyncio.gather(*(
+            self._run_jobs(pending, search_sem, download_sem)
+            for _ in range(runners)
+        ))
         
         # Organize results
         completed = [r for r in self.results if r.success]
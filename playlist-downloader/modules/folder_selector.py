@@ -7,10 +7,19 @@ Supports GUI file dialogs on all platforms and CLI fallback.
 """
 
 import os
-import sys
 from pathlib import Path
 from typing import Optional
 
+# Sensible default locations, the same on Windows, macOS and Linux:
+# ./downloads, ~/Music and ~/Documents
+_HOME = str(Path.home())
+_CWD = os.getcwd()
+_COMMON_DIRS = (
+    os.path.join(_CWD, 'downloads'),
+    os.path.join(_HOME, 'Music'),
+    os.path.join(_HOME, 'Documents'),
+)
+
 
 def select_folder_gui() -> Optional[str]:
     """
@@ -65,7 +74,7 @@ def create_folder_interactive(base_path: str, folder_name: str) -> Optional[str]
         full_path = os.path.join(base_path, folder_name)
         
         # Check if already exists
-        if os.path.exists(full_path):
+        if os.path.isdir(full_path):
             print(f"✓ Folder already exists: {full_path}")
             return full_path
         
@@ -98,25 +107,6 @@ def select_folder_cli() -> Optional[str]:
     
     console = Console()
     
-    # Get some sensible default locations
-    home_dir = str(Path.home())
-    current_dir = os.getcwd()
-    default_dir = os.path.join(current_dir, 'downloads')
-    
-    # Common locations for different platforms
-    if sys.platform == 'win32':
-        music_dir = os.path.join(home_dir, 'Music')
-        docs_dir = os.path.join(home_dir, 'Documents')
-        common_dirs = [default_dir, music_dir, docs_dir]
-    elif sys.platform == 'darwin':  # macOS
-        music_dir = os.path.join(home_dir, 'Music')
-        docs_dir = os.path.join(home_dir, 'Documents')
-        common_dirs = [default_dir, music_dir, docs_dir]
-    else:  # Linux
-        music_dir = os.path.join(home_dir, 'Music')
-        docs_dir = os.path.join(home_dir, 'Documents')
-        common_dirs = [default_dir, music_dir, docs_dir]
-    
     console.print("\n")
     console.rule("[bold cyan]📁 Choose Download Location[/bold cyan]")
     console.print()
@@ -129,13 +119,24 @@ def select_folder_cli() -> Optional[str]:
     table.add_column("Location", style="green")
     table.add_column("Description", style="dim")
     
+    # One listing of the home folder covers ~/Music and ~/Documents
+    try:
+        with os.scandir(_HOME) as entries:
+            home_dirs = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        home_dirs = set()
+    
     suggestions = []
-    for idx, dir_path in enumerate(common_dirs, 1):
-        exists = "✓ exists" if os.path.exists(dir_path) else "will be created"
+    for idx, dir_path in enumerate(_COMMON_DIRS, 1):
+        if os.path.dirname(dir_path) == _HOME:
+            found = os.path.basename(dir_path) in home_dirs
+        else:
+            found = os.path.isdir(dir_path)
+        exists = "✓ exists" if found else "will be created"
         suggestions.append(dir_path)
         
         # Shorten path for display
-        display_path = dir_path.replace(home_dir, "~")
+        display_path = dir_path.replace(_HOME, "~")
         
         if idx == 1:
             desc = f"Default location ({exists})"
@@ -166,7 +167,7 @@ def select_folder_cli() -> Optional[str]:
             console.print(f"\n[cyan]Selected: [bold]{selected_path}[/bold][/cyan]")
             
             # Create if doesn't exist
-            if not os.path.exists(selected_path):
+            if not os.path.isdir(selected_path):
                 if Confirm.ask(f"[yellow]Folder doesn't exist. Create it?[/yellow]", default=True):
                     try:
                         os.makedirs(selected_path, exist_ok=True)
@@ -186,7 +187,7 @@ def select_folder_cli() -> Optional[str]:
             # Custom path input
             console.print()
             console.print("[dim]Examples:[/dim]")
-            console.print(f"  [dim]- {os.path.join(home_dir, 'MyMusic')}[/dim]")
+            console.print(f"  [dim]- {os.path.join(_HOME, 'MyMusic')}[/dim]")
             console.print(f"  [dim]- /mnt/external/Music[/dim]")
             console.print(f"  [dim]- ~/Downloads/Playlists[/dim]")
             console.print()
@@ -201,7 +202,7 @@ def select_folder_cli() -> Optional[str]:
             try:
                 # Check if parent exists
                 parent_dir = os.path.dirname(custom_path)
-                if not os.path.exists(parent_dir):
+                if not os.path.isdir(parent_dir):
                     console.print(f"[red]✗ Parent directory doesn't exist: {parent_dir}[/red]")
                     if Confirm.ask("[yellow]Try again?[/yellow]", default=True):
                         continue
@@ -209,7 +210,7 @@ def select_folder_cli() -> Optional[str]:
                         return None
                 
                 # Create the folder
-                if not os.path.exists(custom_path):
+                if not os.path.isdir(custom_path):
                     if Confirm.ask(f"[yellow]Create folder: {custom_path}?[/yellow]", default=True):
                         os.makedirs(custom_path, exist_ok=True)
                         console.print(f"[green]✓ Created folder: {custom_path}[/green]")
@@ -252,7 +253,7 @@ def select_download_folder(use_gui: bool = True) -> Optional[str]:
         if folder_path:
             # Validate and create if needed
             try:
-                if not os.path.exists(folder_path):
+                if not os.path.isdir(folder_path):
                     os.makedirs(folder_path, exist_ok=True)
                     print(f"✓ Created folder: {folder_path}")
                 else:
@@ -22,30 +22,128 @@ Usage:
     stats = tagger.process_directory(Path("/music/folder"), recursive=True)
 """
 
+import io
 import os
+import re
 import json
 import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Iterator, Optional, Dict, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import mutagen
 from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB, TDRC, TRCK, TPE2, TPOS
 from mutagen.flac import FLAC, Picture
 from mutagen.oggvorbis import OggVorbis
 from mutagen.mp4 import MP4, MP4Cover
 from spotipy import Spotify
+from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyClientCredentials
+from modules.utils import CACHE_DIR, TokenBucket, enable_fast_json
+
+# Pillow is optional; only needed when cover art downscaling is enabled
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 # Configuration
-SUPPORTED_FORMATS = (".mp3", ".flac", ".ogg", ".opus", ".m4a", ".aac", ".alac", ".wav", ".aiff", ".wma", ".dsf")
+SUPPORTED_FORMATS = frozenset({".mp3", ".flac", ".ogg", ".opus", ".m4a", ".aac", ".alac", ".wav", ".aiff", ".wma", ".dsf"})
+
+# Filename noise removed before searching: track numbers, bracketed numbers,
+# years in parentheses, and extensions
+FILENAME_CLEANUP_RE = re.compile(
+    r'\d+\.\s*|\[\d+\]\s*|\(\d{4}\)|\.mp3$|\.flac$|\.m4a$',
+    re.IGNORECASE
+)
+
+# Common separators between artist and title
+FILENAME_SEPARATOR_RE = re.compile(r' - | – | — |_-_| \| ')
+
+# Files tagged in parallel by process_directory (kept low for Spotify's rate limit)
+DEFAULT_WORKERS = 8
+
+# Spotify search throttling: average requests per second, and how many times
+# a search is retried after an HTTP 429 response
+SPOTIFY_SEARCH_RATE = 10.0
+SPOTIFY_MAX_RETRIES = 3
+
+# Keep-alive pool size for cover art downloads
+COVER_ART_POOL_SIZE = 16
+
+# Files already fully tagged, keyed by resolved path, shared by every library
+DEFAULT_SEEN_DB = os.path.join(CACHE_DIR, 'tagged.sqlite')
+
+# JPEG quality used when re-encoding downscaled cover art
+COVER_ART_QUALITY = 92
 
 logger = logging.getLogger(__name__)
 
 
+def detect_image_mime(data: bytes) -> str:
+    """
+    Detect the MIME type of cover art from its leading bytes
+    
+    Args:
+        data: Image bytes
+        
+    Returns:
+        MIME type string (JPEG if the format isn't recognized)
+    """
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return "image/png"
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return "image/webp"
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return "image/gif"
+    return "image/jpeg"
+
+
+def iter_audio_files(directory: Path, recursive: bool = True) -> Iterator[Path]:
+    """
+    Yield supported audio files in a directory
+    Uses os.scandir, whose entries already know their name and type, so
+    non-audio files cost no extra stat() call or Path object
+    
+    Args:
+        directory: Directory to scan
+        recursive: If True, include subdirectories
+        
+    Yields:
+        Path of each supported audio file
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError as e:
+        # Skip unreadable folders instead of aborting the whole scan
+        logger.warning(f"Skipping unreadable directory {directory}: {e}")
+        return
+    
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if recursive:
+                    yield from iter_audio_files(entry.path, recursive)
+            elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS and entry.is_file():
+                yield Path(entry.path)
+
+
 class MetadataTagger:
     """High-quality metadata tagger for audio files using Spotify API"""
     
-    def __init__(self, client_id: str = None, client_secret: str = None, sp: Spotify = None):
+    def __init__(self, client_id: str = None, client_secret: str = None, sp: Spotify = None,
+                 workers: int = DEFAULT_WORKERS, seen_db: Optional[str] = None,
+                 session: Optional[requests.Session] = None, max_art_px: Optional[int] = None):
         """
         Initialize the metadata tagger
         
@@ -53,7 +151,20 @@ class MetadataTagger:
             client_id: Spotify client ID (optional if sp is provided)
             client_secret: Spotify client secret (optional if sp is provided)
             sp: Pre-configured Spotify client (optional)
+            workers: Number of files process_directory tags in parallel
+            seen_db: SQLite file remembering files already tagged, so unchanged
+                files are skipped on later runs without being opened (optional)
+            session: HTTP session for cover art downloads (optional, one is created if omitted)
+            max_art_px: Downscale cover art larger than this many pixels per side
+                (optional, requires Pillow; by default artwork is embedded untouched)
         """
+        self.workers = workers
+        self.max_art_px = max_art_px
+        if max_art_px and not PIL_AVAILABLE:
+            logger.warning("Pillow is not installed - cover art will not be downscaled")
+        self._stats_lock = threading.Lock()
+        self.rate_limiter = TokenBucket(SPOTIFY_SEARCH_RATE)
+        self.session = session or self._create_session()
         if sp:
             self.sp = sp
         elif client_id and client_secret:
@@ -61,7 +172,9 @@ class MetadataTagger:
                 client_id=client_id,
                 client_secret=client_secret
             )
-            self.sp = Spotify(auth_manager=auth_manager)
+            # Search results are large JSON bodies; parse them with orjson when available
+            self.sp = Spotify(auth_manager=auth_manager,
+                              requests_session=enable_fast_json(self._create_session()))
         else:
             self.sp = None
         
@@ -72,6 +185,73 @@ class MetadataTagger:
             'skipped': 0,
             'already_tagged': 0
         }
+        
+        # Cover art per album (album ID, or image URL if there's no ID); the
+        # first thread to need an album downloads it, the others wait on its Future
+        self._album_art_cache: Dict[str, Future] = {}
+        self._album_art_lock = threading.Lock()
+        
+        # Spotify search results per (artist, title) from the filename
+        self._search_cache: Dict[Tuple[str, str], Optional[Dict]] = {}
+        self._search_cache_lock = threading.Lock()
+        
+        # Files known to be fully tagged, keyed by path, size and mtime
+        self._seen_db = None
+        self._seen_lock = threading.Lock()
+        if seen_db:
+            os.makedirs(os.path.dirname(os.path.abspath(seen_db)), exist_ok=True)
+            self._seen_db = sqlite3.connect(seen_db, check_same_thread=False)
+            self._seen_db.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY)")
+            self._seen_db.commit()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session so cover art downloads reuse TLS connections"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=COVER_ART_POOL_SIZE,
+            pool_maxsize=COVER_ART_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def close(self):
+        """Close the already-tagged files database"""
+        if self._seen_db:
+            self._seen_db.close()
+            self._seen_db = None
+    
+    def _seen_key(self, file_path: Path) -> Optional[str]:
+        """Key identifying this exact version of a file, or None if it can't be stat'ed"""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        return f"{file_path.resolve()}|{st.st_size}|{st.st_mtime_ns}"
+    
+    def _is_seen(self, file_path: Path) -> bool:
+        """Check if this version of the file was already fully tagged"""
+        if not self._seen_db:
+            return False
+        key = self._seen_key(file_path)
+        if key is None:
+            return False
+        with self._seen_lock:
+            row = self._seen_db.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None
+    
+    def _mark_seen(self, file_path: Path):
+        """Remember the file as fully tagged (call after writing tags, as that changes mtime)"""
+        if not self._seen_db:
+            return
+        key = self._seen_key(file_path)
+        if key is None:
+            return
+        with self._seen_lock:
+            self._seen_db.execute("INSERT OR REPLACE INTO seen (key) VALUES (?)", (key,))
+            self._seen_db.commit()
     
     def get_highest_quality_image_url(self, images: List[Dict]) -> Optional[str]:
         """
@@ -107,9 +287,11 @@ class MetadataTagger:
             Image data as bytes, or None if download fails
         """
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             image_data = response.content
+            if self.max_art_px and PIL_AVAILABLE:
+                image_data = self.shrink_cover_art(image_data)
             
             size_mb = len(image_data) / 1024 / 1024
             logger.info(f"Downloaded cover art: {size_mb:.2f}MB")
@@ -119,6 +301,68 @@ class MetadataTagger:
             logger.error(f"Failed to download cover art from {url}: {e}")
             return None
     
+    def shrink_cover_art(self, image_data: bytes) -> bytes:
+        """
+        Downscale cover art to max_art_px and re-encode it as progressive JPEG
+        Images already within the limit are returned unchanged
+        
+        Args:
+            image_data: Original image bytes
+            
+        Returns:
+            Downscaled JPEG bytes, or the original bytes if no resize was needed or it failed
+        """
+        try:
+            with Image.open(io.BytesIO(image_data)) as img:
+                if max(img.size) <= self.max_art_px:
+                    return image_data
+                
+                img.thumbnail((self.max_art_px, self.max_art_px), Image.LANCZOS)
+                buffer = io.BytesIO()
+                img.convert("RGB").save(buffer, "JPEG", quality=COVER_ART_QUALITY,
+                                        progressive=True, optimize=True)
+                return buffer.getvalue()
+        except Exception as e:
+            logger.warning(f"Could not resize cover art, embedding original: {e}")
+            return image_data
+    
+    def get_album_cover_art(self, album: Dict) -> Optional[bytes]:
+        """
+        Get the highest quality cover art for an album, downloading it
+        only once per album no matter how many tracks share it
+        
+        Args:
+            album: Album dictionary from Spotify API
+            
+        Returns:
+            Image data as bytes, or None if unavailable
+        """
+        cover_url = self.get_highest_quality_image_url(album.get("images"))
+        if not cover_url:
+            return None
+        
+        key = album.get("id") or cover_url
+        with self._album_art_lock:
+            future = self._album_art_cache.get(key)
+            owner = future is None
+            if owner:
+                future = self._album_art_cache[key] = Future()
+        
+        if owner:
+            try:
+                cover_data = self.download_cover_art(cover_url)
+            except BaseException as e:
+                with self._album_art_lock:
+                    self._album_art_cache.pop(key, None)
+                future.set_exception(e)
+                raise
+            # A failed download isn't remembered, so later tracks of the album retry it
+            if cover_data is None:
+                with self._album_art_lock:
+                    self._album_art_cache.pop(key, None)
+            future.set_result(cover_data)
+        return future.result()
+    
     def extract_info_from_filename(self, filename: str) -> Dict[str, str]:
         """
         Extract track info from filename using common patterns
@@ -129,39 +373,50 @@ class MetadataTagger:
         Returns:
             Dictionary with 'artist' and/or 'title' keys
         """
-        import re
-        
         filename = Path(filename).stem
         
         # Remove common prefixes/suffixes
-        cleanup_patterns = [
-            r'\d+\.\s*',  # Track numbers
-            r'\[\d+\]\s*',  # Bracketed numbers
-            r'\(\d{4}\)',  # Years in parentheses
-            r'\.mp3$|\.flac$|\.m4a$',  # Extensions
-        ]
-        
-        for pattern in cleanup_patterns:
-            filename = re.sub(pattern, '', filename, flags=re.IGNORECASE)
-        
-        # Common separators for artist - title
-        separators = [' - ', ' – ', ' — ', '_-_', ' | ']
-        
-        for sep in separators:
-            if sep in filename:
-                parts = filename.split(sep, 1)
-                if len(parts) == 2:
-                    return {
-                        'artist': parts[0].strip(),
-                        'title': parts[1].strip()
-                    }
+        filename = FILENAME_CLEANUP_RE.sub('', filename)
+        
+        # Split artist - title at the first separator
+        parts = FILENAME_SEPARATOR_RE.split(filename, maxsplit=1)
+        if len(parts) == 2:
+            return {
+                'artist': parts[0].strip(),
+                'title': parts[1].strip()
+            }
         
         # If no separator found, assume it's just the title
         return {'title': filename.strip()}
     
+    def _spotify_search(self, query: str) -> Dict:
+        """
+        Run one Spotify track search, throttled and retried on HTTP 429
+        
+        Args:
+            query: Spotify search query
+            
+        Returns:
+            Spotify search results dictionary
+        """
+        for attempt in range(SPOTIFY_MAX_RETRIES):
+            self.rate_limiter.acquire()
+            try:
+                return self.sp.search(q=query, type="track", limit=5)
+            except SpotifyException as e:
+                if e.http_status != 429 or attempt == SPOTIFY_MAX_RETRIES - 1:
+                    raise
+                try:
+                    retry_after = int((e.headers or {}).get('Retry-After', 1))
+                except (TypeError, ValueError):
+                    retry_after = 1
+                logger.warning(f"Spotify rate limit hit, retrying in {retry_after}s")
+                time.sleep(retry_after)
+    
     def search_spotify(self, query_info: Dict[str, str]) -> Optional[Dict]:
         """
         Search Spotify for track metadata
+        Results are remembered per (artist, title), so duplicate files only search once
         
         Args:
             query_info: Dictionary with 'artist' and/or 'title' keys
@@ -173,43 +428,89 @@ class MetadataTagger:
             logger.error("Spotify client not initialized")
             return None
         
-        # Build search queries in order of specificity
-        queries = []
+        # Spotify search ignores case, so "ARTIST - Song" and "Artist - song" share an entry
+        key = tuple((query_info.get(field) or '').strip().casefold() for field in ('artist', 'title'))
+        with self._search_cache_lock:
+            if key in self._search_cache:
+                return self._search_cache[key]
+        
+        track, complete = self._search_queries(query_info)
         
+        # Don't remember a miss caused by errors - the next file may succeed
+        if track or complete:
+            with self._search_cache_lock:
+                self._search_cache[key] = track
+        
+        return track
+    
+    @staticmethod
+    def _iter_queries(query_info: Dict[str, str]) -> Iterator[str]:
+        """
+        Yield search queries in order of specificity
+        Queries are only built when the previous one found nothing
+        
+        Args:
+            query_info: Dictionary with 'artist' and/or 'title' keys
+            
+        Yields:
+            Spotify search query strings
+        """
         if 'artist' in query_info and 'title' in query_info:
-            queries.append(f'track:"{query_info["title"]}" artist:"{query_info["artist"]}"')
-            queries.append(f'{query_info["artist"]} {query_info["title"]}')
+            yield f'track:"{query_info["title"]}" artist:"{query_info["artist"]}"'
+            yield f'{query_info["artist"]} {query_info["title"]}'
         
         if 'title' in query_info:
-            queries.append(f'track:"{query_info["title"]}"')
-            queries.append(query_info['title'])
+            yield f'track:"{query_info["title"]}"'
+            yield query_info['title']
+    
+    def _search_queries(self, query_info: Dict[str, str]) -> Tuple[Optional[Dict], bool]:
+        """
+        Try search queries in order of specificity until one matches
         
+        Args:
+            query_info: Dictionary with 'artist' and/or 'title' keys
+            
+        Returns:
+            Tuple of (Spotify track data or None, whether every query ran without error)
+        """
         # Try each query
-        for query in queries:
+        complete = True
+        for query in self._iter_queries(query_info):
             try:
-                results = self.sp.search(q=query, type="track", limit=5)
+                results = self._spotify_search(query)
                 if results["tracks"]["items"]:
                     track = results["tracks"]["items"][0]
                     logger.info(f"Found match: {track['artists'][0]['name']} - {track['name']}")
-                    return track
+                    return track, True
             except Exception as e:
                 logger.warning(f"Spotify search error for query '{query}': {e}")
+                complete = False
                 continue
         
-        return None
+        return None, complete
+    
+    def _open_audio(self, file_path: Path):
+        """Open a file with mutagen, returning None if it can't be read"""
+        try:
+            return mutagen.File(str(file_path))
+        except Exception as e:
+            logger.debug(f"Error opening {file_path}: {e}")
+            return None
     
-    def has_complete_metadata(self, file_path: Path) -> bool:
+    def has_complete_metadata(self, file_path: Path, audio=None) -> bool:
         """
         Check if file already has complete metadata (title, artist, and artwork)
         
         Args:
             file_path: Path to the audio file
+            audio: Already opened mutagen file, to avoid parsing the file again (optional)
             
         Returns:
             True if file has complete metadata, False otherwise
         """
         try:
-            audio = mutagen.File(str(file_path))
+            if audio is None:
+                audio = mutagen.File(str(file_path))
             if not audio:
                 return False
             
@@ -217,7 +518,7 @@ class MetadataTagger:
             if isinstance(audio, mutagen.id3.ID3FileType):
                 has_title = 'TIT2' in audio.tags if audio.tags else False
                 has_artist = 'TPE1' in audio.tags if audio.tags else False
-                has_artwork = 'APIC:' in str(audio.tags) if audio.tags else False
+                has_artwork = any(k.startswith('APIC') for k in audio.tags.keys()) if audio.tags else False
                 return has_title and has_artist and has_artwork
             
             # For FLAC
@@ -248,7 +549,8 @@ class MetadataTagger:
             logger.debug(f"Error checking metadata for {file_path}: {e}")
             return False
     
-    def apply_metadata(self, file_path: Path, spotify_data: Dict, force: bool = False) -> bool:
+    def apply_metadata(self, file_path: Path, spotify_data: Dict, force: bool = False,
+                       audio=None) -> bool:
         """
         Apply high-quality metadata to audio file based on format
         
@@ -259,6 +561,7 @@ class MetadataTagger:
             file_path: Path to the audio file (will NOT be renamed)
             spotify_data: Track data from Spotify API
             force: If True, overwrite existing metadata tags
+            audio: Already opened mutagen file to write to, instead of reopening it (optional)
             
         Returns:
             True if successful, False otherwise
@@ -280,23 +583,23 @@ class MetadataTagger:
             logger.info(f"   Artist: {', '.join(artists)}")
             logger.info(f"   Album: {album}")
             
-            # Download highest quality cover art
-            cover_data = None
-            if spotify_data["album"]["images"]:
-                cover_url = self.get_highest_quality_image_url(spotify_data["album"]["images"])
-                if cover_url:
-                    cover_data = self.download_cover_art(cover_url)
+            # Download highest quality cover art (once per album)
+            cover_data = self.get_album_cover_art(spotify_data["album"])
+            cover_mime = detect_image_mime(cover_data) if cover_data else None
             
             # Apply metadata based on format
             if file_ext == ".mp3":
                 success = self._tag_mp3(file_path, title, artists, album, release_date, 
-                                       track_number, total_tracks, album_artist, cover_data, force)
+                                       track_number, total_tracks, album_artist, cover_data,
+                                       cover_mime, force, audio)
             elif file_ext == ".flac":
                 success = self._tag_flac(file_path, title, artists, album, release_date,
-                                        track_number, total_tracks, album_artist, cover_data, force)
+                                        track_number, total_tracks, album_artist, cover_data,
+                                        cover_mime, force, audio)
             elif file_ext in [".m4a", ".aac", ".alac"]:
                 success = self._tag_mp4(file_path, title, artists, album, release_date,
-                                       track_number, total_tracks, album_artist, cover_data, force)
+                                       track_number, total_tracks, album_artist, cover_data,
+                                       cover_mime, force, audio)
             else:
                 # Fallback to generic tagging
                 success = self._tag_generic(file_path, title, artists, album, release_date,
@@ -312,13 +615,16 @@ class MetadataTagger:
             return False
     
     def _tag_mp3(self, file_path, title, artists, album, release_date, track_num, 
-                 total_tracks, album_artist, cover_data, force=False):
+                 total_tracks, album_artist, cover_data, cover_mime=None, force=False, handle=None):
         """Tag MP3 files using ID3v2.4"""
         try:
-            try:
-                audio = ID3(str(file_path))
-            except mutagen.id3.ID3NoHeaderError:
-                audio = ID3()
+            if isinstance(handle, mutagen.id3.ID3FileType) and handle.tags is not None:
+                audio = handle.tags
+            else:
+                try:
+                    audio = ID3(str(file_path))
+                except mutagen.id3.ID3NoHeaderError:
+                    audio = ID3()
             
             # Clear existing tags if force
             if force:
@@ -337,14 +643,9 @@ class MetadataTagger:
             
             # Album artwork - highest quality
             if cover_data:
-                # Detect image format
-                mime = "image/jpeg"
-                if cover_data[:4] == b'\x89PNG':
-                    mime = "image/png"
-                
                 audio.add(APIC(
                     encoding=3,
-                    mime=mime,
+                    mime=cover_mime or "image/jpeg",
                     type=3,  # Cover (front)
                     desc="Cover",
                     data=cover_data
@@ -359,10 +660,10 @@ class MetadataTagger:
             return False
     
     def _tag_flac(self, file_path, title, artists, album, release_date, track_num, 
-                  total_tracks, album_artist, cover_data, force=False):
+                  total_tracks, album_artist, cover_data, cover_mime=None, force=False, handle=None):
         """Tag FLAC files"""
         try:
-            audio = FLAC(str(file_path))
+            audio = handle if isinstance(handle, FLAC) else FLAC(str(file_path))
             
             # Clear existing tags if force
             if force:
@@ -383,14 +684,9 @@ class MetadataTagger:
             
             # Album artwork - highest quality
             if cover_data:
-                # Detect image format
-                mime = "image/jpeg"
-                if cover_data[:4] == b'\x89PNG':
-                    mime = "image/png"
-                
                 picture = Picture()
                 picture.type = 3  # Cover (front)
-                picture.mime = mime
+                picture.mime = cover_mime or "image/jpeg"
                 picture.desc = "Cover"
                 picture.data = cover_data
                 
@@ -406,10 +702,10 @@ class MetadataTagger:
             return False
     
     def _tag_mp4(self, file_path, title, artists, album, release_date, track_num, 
-                 total_tracks, album_artist, cover_data, force=False):
+                 total_tracks, album_artist, cover_data, cover_mime=None, force=False, handle=None):
         """Tag MP4/M4A files"""
         try:
-            audio = MP4(str(file_path))
+            audio = handle if isinstance(handle, MP4) else MP4(str(file_path))
             
             # Clear existing tags if force
             if force:
@@ -427,10 +723,8 @@ class MetadataTagger:
             
             # Album artwork - highest quality
             if cover_data:
-                # Detect image format
-                cover_format = MP4Cover.FORMAT_JPEG
-                if cover_data[:4] == b'\x89PNG':
-                    cover_format = MP4Cover.FORMAT_PNG
+                # MP4 covers can only be declared as JPEG or PNG
+                cover_format = MP4Cover.FORMAT_PNG if cover_mime == "image/png" else MP4Cover.FORMAT_JPEG
                 
                 audio["covr"] = [MP4Cover(cover_data, cover_format)]
                 logger.info(f"Added high-quality cover art ({len(cover_data) / 1024:.1f}KB) to M4A")
@@ -471,6 +765,11 @@ class MetadataTagger:
             logger.error(f"Generic tagging error: {e}")
             return False
     
+    def _count(self, key: str):
+        """Increment a statistics counter (safe to call from worker threads)"""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
     def process_file(self, file_path: Path, force: bool = False, use_filename_as_source: bool = True) -> Tuple[bool, str]:
         """
         Process a single audio file - search for metadata and apply it
@@ -487,19 +786,29 @@ class MetadataTagger:
             Tuple of (success: bool, status: str)
             Status can be: 'tagged', 'skipped', 'no_match', 'error'
         """
-        self.stats['processed'] += 1
+        self._count('processed')
         
         try:
             # Check if file is supported
             if file_path.suffix.lower() not in SUPPORTED_FORMATS:
                 logger.warning(f"Unsupported file format: {file_path.name}")
-                self.stats['errors'] += 1
+                self._count('errors')
                 return False, 'error'
             
+            # Files tagged on an earlier run and untouched since are skipped without opening them
+            if not force and self._is_seen(file_path):
+                logger.info(f"Already has complete metadata: {file_path.name}")
+                self._count('already_tagged')
+                return True, 'skipped'
+            
+            # Open the file once; the same handle is checked and then tagged
+            audio = self._open_audio(file_path)
+            
             # Check if already has complete metadata
-            if not force and self.has_complete_metadata(file_path):
+            if not force and self.has_complete_metadata(file_path, audio=audio):
                 logger.info(f"Already has complete metadata: {file_path.name}")
-                self.stats['already_tagged'] += 1
+                self._mark_seen(file_path)
+                self._count('already_tagged')
                 return True, 'skipped'
             
             # PRIORITY: Use filename as the source of truth for what the song actually is
@@ -509,10 +818,10 @@ class MetadataTagger:
             # AND we're not using filename as source
             if not use_filename_as_source:
                 try:
-                    audio = mutagen.File(str(file_path), easy=True)
-                    if audio:
-                        existing_title = audio.get("title", [""])[0] if audio.get("title") else ""
-                        existing_artist = audio.get("artist", [""])[0] if audio.get("artist") else ""
+                    audio_easy = mutagen.File(str(file_path), easy=True)
+                    if audio_easy:
+                        existing_title = audio_easy.get("title", [""])[0] if audio_easy.get("title") else ""
+                        existing_artist = audio_easy.get("artist", [""])[0] if audio_easy.get("artist") else ""
                         
                         if existing_title and not query_info.get('title'):
                             query_info['title'] = existing_title
@@ -530,7 +839,7 @@ class MetadataTagger:
             if not spotify_data:
                 logger.warning(f"❌ No match found for: {file_path.name}")
                 logger.warning(f"   The filename will stay unchanged. Try renaming to: 'Artist - Title.ext'")
-                self.stats['errors'] += 1
+                self._count('errors')
                 return False, 'no_match'
             
             # Show what we found
@@ -539,17 +848,20 @@ class MetadataTagger:
             logger.info(f"✓ Found match: {found_artist} - {found_title}")
             
             # Apply metadata (this only changes internal tags, NOT the filename)
-            if self.apply_metadata(file_path, spotify_data, force):
+            if self.apply_metadata(file_path, spotify_data, force, audio=audio):
                 logger.info(f"✓ Tagged file (filename unchanged): {file_path.name}")
-                self.stats['tagged'] += 1
+                # Files tagged without cover art stay unseen so the art is retried next run
+                if self.has_complete_metadata(file_path):
+                    self._mark_seen(file_path)
+                self._count('tagged')
                 return True, 'tagged'
             else:
-                self.stats['errors'] += 1
+                self._count('errors')
                 return False, 'error'
                 
         except Exception as e:
             logger.error(f"Error processing {file_path.name}: {e}")
-            self.stats['errors'] += 1
+            self._count('errors')
             return False, 'error'
     
     def process_directory(self, directory: Path, recursive: bool = True, force: bool = False):
@@ -567,15 +879,13 @@ class MetadataTagger:
         logger.info(f"Processing directory: {directory}")
         
         # Find all audio files
-        if recursive:
-            audio_files = [f for f in directory.rglob("*") if f.is_file() and f.suffix.lower() in SUPPORTED_FORMATS]
-        else:
-            audio_files = [f for f in directory.glob("*") if f.is_file() and f.suffix.lower() in SUPPORTED_FORMATS]
+        audio_files = list(iter_audio_files(directory, recursive))
         
         logger.info(f"Found {len(audio_files)} audio files")
         
-        for file_path in audio_files:
-            self.process_file(file_path, force)
+        # Each file is mostly waiting on Spotify and disk I/O, so tag several at once
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(lambda file_path: self.process_file(file_path, force), audio_files))
         
         return self.stats
     
@@ -611,8 +921,6 @@ def refresh_metadata_for_directory(directory: str, client_id: str = None,
     Returns:
         Statistics dictionary with processing results
     """
-    tagger = MetadataTagger(client_id=client_id, client_secret=client_secret, sp=sp)
-    
     directory_path = Path(directory)
     if not directory_path.exists():
         raise ValueError(f"Directory does not exist: {directory}")
@@ -620,4 +928,9 @@ def refresh_metadata_for_directory(directory: str, client_id: str = None,
     if not directory_path.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
     
-    return tagger.process_directory(directory_path, recursive=recursive, force=force)
+    tagger = MetadataTagger(client_id=client_id, client_secret=client_secret, sp=sp,
+                            seen_db=DEFAULT_SEEN_DB)
+    try:
+        return tagger.process_directory(directory_path, recursive=recursive, force=force)
+    finally:
+        tagger.close()
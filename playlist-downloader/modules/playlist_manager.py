@@ -6,19 +6,94 @@ Provides unified interface for different playlist sources.
 """
 
 import asyncio
+import atexit
 import json
 import logging
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Dict, Optional, Tuple
+from dataclasses import dataclass, fields
+from functools import cached_property
 from abc import ABC, abstractmethod
 
+import requests
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
-from modules.utils import sanitize_filename, extract_playlist_id
+from modules.utils import extract_playlist_id, json_loads, sanitize_filename
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Shared with main.py so the OAuth token survives across processes
+DEFAULT_SPOTIFY_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.config', '.spotipy-cache'
+)
+
+# Slotted dataclasses drop the per-instance __dict__ (keyword needs Python 3.10+)
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Playlist types accepted in the label:type:url playlist file format
+PLAYLIST_TYPES = frozenset({'spotify', 'youtube'})
+
+# Maximum number of playlists fetched at the same time
+MAX_CONCURRENT_FETCHES = 8
+
+# Tracks per Spotify playlist page (the API maximum)
+SPOTIFY_PAGE_SIZE = 100
+
+# Playlist pages requested from Spotify at the same time, across all playlists
+SPOTIFY_PAGE_WORKERS = 8
+
+# One page pool shared by every fetch, so concurrent playlists can't multiply
+# the number of in-flight Spotify API calls
+_spotify_page_pool = ThreadPoolExecutor(
+    max_workers=SPOTIFY_PAGE_WORKERS, thread_name_prefix='spotify-page'
+)
+
+# Only the track fields we use, to keep each page's response small
+SPOTIFY_TRACK_FIELDS = 'items(track(name,artists(name),album(name),duration_ms))'
+
+# Longest single line of yt-dlp JSON output accepted (one playlist entry)
+YT_DLP_LINE_LIMIT = 1024 * 1024
+
+# Event loops reused by the synchronous wrappers, one per calling thread
+_loops = threading.local()
+_all_loops: List[asyncio.AbstractEventLoop] = []
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion on this thread's reusable event loop.
+    
+    Unlike asyncio.run, repeated calls don't create and tear down a new
+    loop each time. The loops are closed at interpreter exit.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    loop = getattr(_loops, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _loops.loop = loop
+        _all_loops.append(loop)
+    return loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_loops() -> None:
+    """Close every event loop created by _run_sync."""
+    for loop in _all_loops:
+        if not loop.is_closed():
+            loop.close()
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Track:
     """Represents a single track from a playlist."""
     name: str
@@ -40,23 +115,114 @@ class Track:
 
 @dataclass
 class Playlist:
-    """Represents a playlist with metadata and tracks."""
+    """
+    Represents a playlist with metadata and tracks.
+    
+    Not slotted (unlike Track): there are few playlists per run, and the
+    derived values below are cached in the instance __dict__.
+    """
     name: str
     label: str
     playlist_type: str  # 'spotify' or 'youtube'
     url: str
     tracks: List[Track]
     
-    @property
+    @cached_property
     def sanitized_name(self) -> str:
         """Get sanitized playlist name for directory creation."""
         return sanitize_filename(self.name)
     
+    @cached_property
+    def tracks_by_filename(self) -> Dict[str, Track]:
+        """Tracks indexed by sanitized filename, in playlist order (duplicates collapse)."""
+        return {track.filename: track for track in self.tracks}
+    
     def __len__(self) -> int:
         """Return number of tracks in playlist."""
         return len(self.tracks)
 
 
+# Track fields in constructor order, used for the cache's column layout
+TRACK_FIELDS = tuple(field.name for field in fields(Track))
+
+
+class PlaylistCache:
+    """
+    On-disk cache of Spotify playlist tracks keyed by playlist ID.
+    
+    Entries are only reused while the playlist's snapshot_id is unchanged,
+    so edited playlists are always refetched. Tracks are stored as one list
+    per field rather than one dict per track, which keeps the file small
+    and avoids a per-track asdict() copy.
+    """
+    
+    def __init__(self, cache_file: str):
+        """
+        Load the cache file if it exists.
+        
+        Args:
+            cache_file: Path to the JSON cache file
+        """
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict] = {}
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Ignoring unreadable playlist cache {cache_file}: {e}")
+    
+    def get(self, playlist_id: str, snapshot_id: Optional[str]) -> Optional[List[Track]]:
+        """
+        Get cached tracks for a playlist snapshot.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            snapshot_id: Current snapshot_id reported by Spotify
+            
+        Returns:
+            List of Track objects, or None if not cached or stale
+        """
+        entry = self.entries.get(playlist_id)
+        if not snapshot_id or not entry or entry.get('snapshot_id') != snapshot_id:
+            return None
+        
+        # Entries written in the older per-track layout are simply refetched
+        columns = entry.get('columns')
+        if not columns:
+            return None
+        return [Track(*row) for row in zip(*(columns[name] for name in TRACK_FIELDS))]
+    
+    def set(self, playlist_id: str, snapshot_id: Optional[str], tracks: List[Track]) -> None:
+        """
+        Store tracks for a playlist snapshot.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            snapshot_id: Snapshot the tracks were fetched from
+            tracks: Fetched Track objects
+        """
+        if snapshot_id:
+            self.entries[playlist_id] = {
+                'snapshot_id': snapshot_id,
+                'columns': {
+                    name: [getattr(track, name) for track in tracks]
+                    for name in TRACK_FIELDS
+                }
+            }
+    
+    def save(self) -> None:
+        """Write the cache to disk."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+        except IOError as e:
+            logger.error(f"Failed to save playlist cache: {e}")
+
+
 class PlaylistFetcher(ABC):
     """Abstract base class for playlist fetchers."""
     
@@ -78,7 +244,15 @@ class PlaylistFetcher(ABC):
 class SpotifyPlaylistFetcher(PlaylistFetcher):
     """Fetches playlists from Spotify using the Spotify API."""
     
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        cache_path: str = DEFAULT_SPOTIFY_CACHE_PATH,
+        session: Optional[requests.Session] = None,
+        playlist_cache: Optional[PlaylistCache] = None
+    ):
         """
         Initialize Spotify fetcher.
         
@@ -86,19 +260,24 @@ class SpotifyPlaylistFetcher(PlaylistFetcher):
             client_id: Spotify API client ID
             client_secret: Spotify API client secret
             redirect_uri: OAuth redirect URI
+            cache_path: Path to the OAuth token cache file
+            session: Shared HTTP session for token and API requests (optional)
+            playlist_cache: Cache of previously fetched playlist snapshots (optional)
         """
-        self.logger = logging.getLogger(__name__)
+        self.playlist_cache = playlist_cache
         
         try:
             auth_manager = SpotifyOAuth(
                 client_id=client_id,
                 client_secret=client_secret,
                 redirect_uri=redirect_uri,
-                scope="playlist-read-private playlist-read-collaborative"
+                scope="playlist-read-private playlist-read-collaborative",
+                cache_path=cache_path,
+                requests_session=session or True
             )
-            self.sp = spotipy.Spotify(auth_manager=auth_manager)
+            self.sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=session or True)
         except Exception as e:
-            self.logger.error(f"Failed to initialize Spotify client: {e}")
+            logger.error(f"Failed to initialize Spotify client: {e}")
             raise
     
     def fetch_playlist(self, url: str, label: str) -> Optional[Playlist]:
@@ -115,35 +294,58 @@ class SpotifyPlaylistFetcher(PlaylistFetcher):
         try:
             playlist_id = extract_playlist_id(url)
             
-            # Fetch playlist metadata
-            playlist_info = self.sp.playlist(playlist_id)
+            # Fetch only the playlist name, its change token and track count
+            playlist_info = self.sp.playlist(playlist_id, fields='name,snapshot_id,tracks.total')
             playlist_name = playlist_info['name']
+            snapshot_id = playlist_info.get('snapshot_id')
+            total = playlist_info['tracks']['total']
             
-            self.logger.info(f"Fetching Spotify playlist: {playlist_name}")
+            if self.playlist_cache:
+                cached_tracks = self.playlist_cache.get(playlist_id, snapshot_id)
+                if cached_tracks is not None:
+                    logger.info(f"Playlist unchanged, using cached tracks: {playlist_name}")
+                    return Playlist(
+                        name=playlist_name,
+                        label=label,
+                        playlist_type='spotify',
+                        url=url,
+                        tracks=cached_tracks
+                    )
             
-            # Fetch all tracks with pagination
-            tracks = []
-            results = self.sp.playlist_tracks(playlist_id)
-            
-            while results:
-                for item in results['items']:
-                    if item['track'] and item['track']['name']:
-                        track_data = item['track']
-                        track = Track(
-                            name=track_data['name'],
-                            artist=track_data['artists'][0]['name'] if track_data['artists'] else 'Unknown Artist',
-                            album=track_data['album']['name'] if track_data['album'] else 'Unknown Album',
-                            duration_ms=track_data.get('duration_ms', 0)
-                        )
-                        tracks.append(track)
-                
-                # Handle pagination
-                if results['next']:
-                    results = self.sp.next(results)
-                else:
-                    break
+            logger.info(f"Fetching Spotify playlist: {playlist_name}")
+            
+            # Every page offset is known from the total, so fetch all pages at once
+            offsets = range(0, total, SPOTIFY_PAGE_SIZE)
+            pages = _spotify_page_pool.map(
+                lambda offset: self.sp.playlist_tracks(
+                    playlist_id,
+                    fields=SPOTIFY_TRACK_FIELDS,
+                    limit=SPOTIFY_PAGE_SIZE,
+                    offset=offset
+                ),
+                offsets
+            )
+            
+            # Collect plain column values first, then build every Track in one pass
+            names, artists, albums, durations = [], [], [], []
+            for page in pages:
+                for item in page['items']:
+                    track_data = item.get('track')
+                    if track_data and track_data.get('name'):
+                        # Filtered responses omit fields the item doesn't have
+                        artists_list = track_data.get('artists') or ()
+                        album_data = track_data.get('album')
+                        names.append(track_data['name'])
+                        artists.append(artists_list[0]['name'] if artists_list else 'Unknown Artist')
+                        albums.append(album_data['name'] if album_data else 'Unknown Album')
+                        durations.append(track_data.get('duration_ms', 0))
+            
+            tracks = [Track(*row) for row in zip(names, artists, albums, durations)]
             
-            self.logger.info(f"Fetched {len(tracks)} tracks from {playlist_name}")
+            logger.info(f"Fetched {len(tracks)} tracks from {playlist_name}")
+            
+            if self.playlist_cache:
+                self.playlist_cache.set(playlist_id, snapshot_id, tracks)
             
             return Playlist(
                 name=playlist_name,
@@ -154,17 +356,13 @@ class SpotifyPlaylistFetcher(PlaylistFetcher):
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to fetch Spotify playlist: {e}")
+            logger.error(f"Failed to fetch Spotify playlist: {e}")
             return None
 
 
 class YouTubePlaylistFetcher(PlaylistFetcher):
     """Fetches playlists from YouTube using yt-dlp."""
     
-    def __init__(self):
-        """Initialize YouTube fetcher."""
-        self.logger = logging.getLogger(__name__)
-    
     async def fetch_playlist_async(self, url: str, label: str) -> Optional[Playlist]:
         """
         Fetch YouTube playlist asynchronously.
@@ -176,43 +374,55 @@ class YouTubePlaylistFetcher(PlaylistFetcher):
         Returns:
             Playlist object or None if fetch fails
         """
+        proc = None
+        stderr_task = None
         try:
-            # Run yt-dlp to get playlist metadata
+            # Run yt-dlp to get playlist metadata, one JSON object per entry
             proc = await asyncio.create_subprocess_exec(
                 "yt-dlp",
                 "--flat-playlist",
-                "-J",
+                "-j",
                 url,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=YT_DLP_LINE_LIMIT
             )
             
-            stdout, stderr = await proc.communicate()
-            
-            if proc.returncode != 0:
-                self.logger.error(f"yt-dlp error: {stderr.decode()}")
-                return None
-            
-            data = json.loads(stdout.decode())
-            playlist_name = data.get('title', label)
-            entries = data.get('entries', [])
+            # Drain stderr alongside stdout so neither pipe can fill up and stall yt-dlp
+            stderr_task = asyncio.ensure_future(proc.stderr.read())
             
-            self.logger.info(f"Fetching YouTube playlist: {playlist_name}")
-            
-            # Convert entries to Track objects
+            # Build tracks as entries arrive instead of buffering the whole playlist
+            playlist_name = None
             tracks = []
-            for entry in entries:
-                if entry and entry.get('id') and entry.get('title'):
+            async for line in proc.stdout:
+                if not line.strip():
+                    continue
+                
+                entry = json_loads(line)
+                if playlist_name is None:
+                    playlist_name = entry.get('playlist_title') or entry.get('playlist') or ''
+                    logger.info(f"Fetching YouTube playlist: {playlist_name or label}")
+                
+                if entry.get('id') and entry.get('title'):
                     track = Track(
                         name=entry['title'],
-                        artist=entry.get('uploader', 'Unknown Uploader'),
+                        artist=entry.get('uploader') or 'Unknown Uploader',
                         album='YouTube',
-                        duration_ms=entry.get('duration', 0) * 1000,  # Convert to ms
+                        duration_ms=int((entry.get('duration') or 0) * 1000),  # Convert to ms
                         url=f"https://www.youtube.com/watch?v={entry['id']}"
                     )
                     tracks.append(track)
             
-            self.logger.info(f"Fetched {len(tracks)} tracks from {playlist_name}")
+            stderr = await stderr_task
+            await proc.wait()
+            
+            if proc.returncode != 0:
+                logger.error(f"yt-dlp error: {stderr.decode()}")
+                return None
+            
+            playlist_name = playlist_name or label
+            
+            logger.info(f"Fetched {len(tracks)} tracks from {playlist_name}")
             
             return Playlist(
                 name=playlist_name,
@@ -223,8 +433,19 @@ class YouTubePlaylistFetcher(PlaylistFetcher):
             )
             
         except Exception as e:
-            self.logger.error(f"Failed to fetch YouTube playlist: {e}")
+            logger.error(f"Failed to fetch YouTube playlist: {e}")
             return None
+        
+        finally:
+            # On a parse error, oversized line or cancellation, don't leave yt-dlp running
+            if stderr_task is not None and not stderr_task.done():
+                stderr_task.cancel()
+            if proc is not None and proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
     
     def fetch_playlist(self, url: str, label: str) -> Optional[Playlist]:
         """
@@ -237,7 +458,7 @@ class YouTubePlaylistFetcher(PlaylistFetcher):
         Returns:
             Playlist object or None if fetch fails
         """
-        return asyncio.run(self.fetch_playlist_async(url, label))
+        return _run_sync(self.fetch_playlist_async(url, label))
 
 
 class PlaylistManager:
@@ -255,7 +476,51 @@ class PlaylistManager:
         """
         self.spotify_fetcher = spotify_fetcher
         self.youtube_fetcher = youtube_fetcher
-        self.logger = logging.getLogger(__name__)
+    
+    def _parse_playlist_lines(self, lines: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """
+        Parse the lines of a playlists file.
+        
+        Args:
+            lines: Lines of the playlists file
+            
+        Returns:
+            List of tuples: (label, type, url)
+        """
+        playlists = []
+        
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            # Split once; every format below is built from these parts
+            parts = [part.strip() for part in line.split(':', 2)]
+            
+            # Parse format: label:type:url
+            if len(parts) == 3 and parts[1] in PLAYLIST_TYPES:
+                playlists.append(tuple(parts))
+            
+            # Legacy format: label:url or just url
+            else:
+                if len(parts) > 1:
+                    label, url = parts[0], ':'.join(parts[1:])
+                else:
+                    url = line
+                    label = url
+                
+                # Auto-detect type
+                if 'spotify.com/playlist/' in url:
+                    ptype = 'spotify'
+                elif 'youtube.com/playlist' in url or 'youtu.be' in url:
+                    ptype = 'youtube'
+                else:
+                    logger.warning(f"Line {line_num}: Cannot determine playlist type, skipping")
+                    continue
+                
+                playlists.append((label, ptype, url))
+        
+        return playlists
     
     def load_playlist_file(self, filepath: str) -> List[Tuple[str, str, str]]:
         """
@@ -270,86 +535,110 @@ class PlaylistManager:
         Returns:
             List of tuples: (label, type, url)
         """
-        playlists = []
-        
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    parts = line.split(':', 2)
-                    
-                    # Parse format: label:type:url
-                    if len(parts) == 3 and parts[1] in ('spotify', 'youtube'):
-                        label, ptype, url = parts
-                        playlists.append((label.strip(), ptype.strip(), url.strip()))
-                    
-                    # Legacy format: label:url or just url
-                    else:
-                        if ':' in line:
-                            label, url = line.split(':', 1)
-                            label = label.strip()
-                            url = url.strip()
-                        else:
-                            url = line.strip()
-                            label = url
-                        
-                        # Auto-detect type
-                        if 'spotify.com/playlist/' in url:
-                            ptype = 'spotify'
-                        elif 'youtube.com/playlist' in url or 'youtu.be' in url:
-                            ptype = 'youtube'
-                        else:
-                            self.logger.warning(f"Line {line_num}: Cannot determine playlist type, skipping")
-                            continue
-                        
-                        playlists.append((label, ptype, url))
-            
-            self.logger.info(f"Loaded {len(playlists)} playlists from {filepath}")
-            
+                playlists = self._parse_playlist_lines(f)
         except FileNotFoundError:
-            self.logger.warning(f"Playlist file not found: {filepath}")
+            logger.warning(f"Playlist file not found: {filepath}")
+            return []
         except IOError as e:
-            self.logger.error(f"Error reading playlist file: {e}")
+            logger.error(f"Error reading playlist file: {e}")
+            return []
         
+        logger.info(f"Loaded {len(playlists)} playlists from {filepath}")
         return playlists
     
-    async def fetch_playlists_async(self, playlist_refs: List[Tuple[str, str, str]]) -> List[Playlist]:
+    async def load_playlist_file_async(self, filepath: str) -> List[Tuple[str, str, str]]:
         """
-        Fetch multiple playlists asynchronously.
+        Load playlists from text file without blocking the event loop.
+        
+        The file is read in one go on a worker thread, then decoded and
+        parsed as a single buffer.
         
         Args:
-            playlist_refs: List of (label, type, url) tuples
+            filepath: Path to playlists file
             
         Returns:
-            List of fetched Playlist objects
+            List of tuples: (label, type, url)
         """
-        playlists = []
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(None, Path(filepath).read_bytes)
+        except FileNotFoundError:
+            logger.warning(f"Playlist file not found: {filepath}")
+            return []
+        except IOError as e:
+            logger.error(f"Error reading playlist file: {e}")
+            return []
+        
+        playlists = self._parse_playlist_lines(data.decode('utf-8').splitlines())
+        logger.info(f"Loaded {len(playlists)} playlists from {filepath}")
+        return playlists
+    
+    async def _fetch_one(
+        self,
+        label: str,
+        ptype: str,
+        url: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Playlist]:
+        """
+        Fetch a single playlist, bounded by semaphore.
         
-        for label, ptype, url in playlist_refs:
+        Args:
+            label: User label for playlist
+            ptype: Playlist type ('spotify' or 'youtube')
+            url: Playlist URL
+            semaphore: Semaphore limiting concurrent fetches
+            
+        Returns:
+            Playlist object or None if fetch fails
+        """
+        async with semaphore:
             try:
                 if ptype == 'spotify':
                     # Spotify API is synchronous, run in executor
-                    loop = asyncio.get_event_loop()
-                    playlist = await loop.run_in_executor(
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
                         None,
                         self.spotify_fetcher.fetch_playlist,
                         url,
                         label
                     )
                 elif ptype == 'youtube':
-                    playlist = await self.youtube_fetcher.fetch_playlist_async(url, label)
+                    return await self.youtube_fetcher.fetch_playlist_async(url, label)
                 else:
-                    self.logger.warning(f"Unknown playlist type: {ptype}")
-                    continue
-                
-                if playlist:
-                    playlists.append(playlist)
+                    logger.warning(f"Unknown playlist type: {ptype}")
                     
             except Exception as e:
-                self.logger.error(f"Failed to fetch playlist {label}: {e}")
+                logger.error(f"Failed to fetch playlist {label}: {e}")
+        
+        return None
+    
+    async def fetch_playlists_async(self, playlist_refs: List[Tuple[str, str, str]]) -> List[Playlist]:
+        """
+        Fetch multiple playlists concurrently.
+        
+        Args:
+            playlist_refs: List of (label, type, url) tuples
+            
+        Returns:
+            List of fetched Playlist objects, in playlist_refs order
+        """
+        # Bounded to stay well inside Spotify's rate limit
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        
+        results = await asyncio.gather(
+            *(self._fetch_one(label, ptype, url, semaphore) for label, ptype, url in playlist_refs),
+            return_exceptions=True
+        )
+        
+        playlists = []
+        for (label, _, _), result in zip(playlist_refs, results):
+            if isinstance(result, Playlist):
+                playlists.append(result)
+            elif isinstance(result, BaseException):
+                logger.error(f"Failed to fetch playlist {label}: {result}")
         
         return playlists
     
@@ -363,4 +652,4 @@ class PlaylistManager:
         Returns:
             List of fetched Playlist objects
         """
-        return asyncio.run(self.fetch_playlists_async(playlist_refs))
+        return _run_sync(self.fetch_playlists_async(playlist_refs))
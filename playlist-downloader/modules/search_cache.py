@@ -0,0 +1,126 @@
+"""
+Search Cache Module
+===================
+Persistent SQLite cache of YouTube search results.
+Lets repeat runs resolve already-searched tracks without hitting YouTube,
+and skip tracks that recently could not be found at all.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from typing import Optional
+
+
+# Cached search results older than this are searched again
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Queries with no results are retried sooner, in case the video gets uploaded
+DEFAULT_NOT_FOUND_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class SearchCache:
+    """Maps search queries to resolved YouTube URLs, stored in SQLite."""
+    
+    def __init__(
+        self,
+        db_path: str,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        not_found_ttl: int = DEFAULT_NOT_FOUND_TTL_SECONDS
+    ):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            ttl: Maximum age of a usable entry in seconds
+            not_found_ttl: How long a query with no results is skipped, in seconds
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self.logger = logging.getLogger(__name__)
+        
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS search ("
+            "query TEXT PRIMARY KEY, url TEXT, ts INTEGER)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS not_found ("
+            "query TEXT PRIMARY KEY, ts INTEGER)"
+        )
+        self.conn.commit()
+    
+    def get(self, query: str) -> Optional[str]:
+        """
+        Look up a cached URL.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Cached YouTube URL, or None if missing or expired
+        """
+        row = self.conn.execute(
+            "SELECT url, ts FROM search WHERE query = ?", (query,)
+        ).fetchone()
+        
+        if row and time.time() - row[1] < self.ttl:
+            return row[0]
+        return None
+    
+    def set(self, query: str, url: str) -> None:
+        """
+        Store a resolved URL for a query.
+        
+        Args:
+            query: Search query string
+            url: Resolved YouTube URL
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO search (query, url, ts) VALUES (?, ?, ?)",
+            (query, url, int(time.time()))
+        )
+        self.conn.commit()
+    
+    def is_not_found(self, query: str) -> bool:
+        """
+        Check whether a query recently returned no results.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            True if the query is known to have no results
+        """
+        row = self.conn.execute(
+            "SELECT ts FROM not_found WHERE query = ?", (query,)
+        ).fetchone()
+        return bool(row) and time.time() - row[0] < self.not_found_ttl
+    
+    def set_not_found(self, query: str) -> None:
+        """
+        Remember that a query returned no results.
+        
+        Args:
+            query: Search query string
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO not_found (query, ts) VALUES (?, ?)",
+            (query, int(time.time()))
+        )
+        self.conn.commit()
+    
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self.conn.execute("DELETE FROM search")
+        self.conn.execute("DELETE FROM not_found")
+        self.conn.commit()
+        self.logger.info(f"Cleared search cache: {self.db_path}")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
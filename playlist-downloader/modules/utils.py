@@ -2,26 +2,91 @@
 Shared Utilities Module
 =======================
 Common functions used across the playlist downloader application.
-Includes file operations, sanitization, and validation utilities.
+Includes file operations, sanitization, validation, JSON and HTTP session helpers.
 """
 
+import asyncio
 import os
 import re
+import functools
 import logging
+import json
+import threading
+import time
+from logging.handlers import MemoryHandler
 from pathlib import Path
-from typing import Set, Optional
+from typing import Any, FrozenSet, Optional, Set, Union
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional; fall back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# App-owned cache files (search results, playlist snapshots, tagged files) live
+# under the project's .config directory, never inside the user's music folders
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.config', 'cache'
+)
 
 # Supported audio file extensions for detection
 AUDIO_EXTENSIONS = {'.mp3', '.m4a', '.opus', '.flac', '.wav', '.ogg', '.aac', '.webm'}
 
+# Log file buffering: records are written in batches, ERROR and above immediately
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 30.0
+
+# Keep-alive pool size for the shared HTTP session
+HTTP_POOL_SIZE = 64
+
+# Retries for rate-limited (429) and transient server errors; Retry-After is honoured
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True
+)
+
+# Characters invalid in filenames on Windows/Linux/macOS, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({
+    **{char: '_' for char in '<>:"/\\|?*'},
+    **{code: '_' for code in range(0x20)}
+})
+_MULTI_UNDERSCORE = re.compile(r'_+')
+
+# Search query noise: bracketed asides, features, remix/remaster tags
+_TITLE_NOISE = re.compile(
+    r'\([^)]*\)|\[[^\]]*\]'
+    r'|(?i:\b(?:feat|ft)\.?\s*[^-–—]*|\bremix\b[^-–—]*|\bremastered\b|\bofficial\b)'
+)
+
+# Dashes that often separate a title from version info
+_TITLE_DASH = re.compile(r'[-–—]')
 
+# Accepted playlist URL formats, by playlist type
+_PLAYLIST_URL_PATTERNS = {
+    'spotify': re.compile(r'https?://open\.spotify\.com/playlist/[\w\d]+'),
+    'youtube': re.compile(r'https?://(www\.)?(youtube\.com/playlist\?list=|youtu\.be/)[\w\-]+'),
+}
+
+# Directories already created or verified by ensure_directory in this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
     """
     Sanitize filename for cross-platform compatibility.
     
     Removes invalid characters, normalizes whitespace, and ensures valid length.
+    Results are memoized, since Track.filename is computed repeatedly per track.
     
     Args:
         filename: Raw filename string
@@ -35,11 +100,10 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
         'Song_ Title_Name'
     """
     # Remove invalid characters for Windows/Linux/macOS
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    sanitized = filename.translate(_SANITIZE_TABLE)
     
     # Normalize multiple underscores to single
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _MULTI_UNDERSCORE.sub('_', sanitized)
     
     # Remove leading/trailing dots and spaces (Windows incompatible)
     sanitized = sanitized.strip('. ')
@@ -74,44 +138,47 @@ def extract_playlist_id(playlist_input: str) -> str:
     return playlist_input
 
 
-def get_downloaded_files(directory: str) -> Set[str]:
+def get_downloaded_files(directory: str) -> FrozenSet[str]:
     """
     Get set of already downloaded file basenames (without extensions).
     
     Scans directory for audio files and returns their names without extensions
-    for quick lookup to avoid re-downloading.
+    for O(1) membership checks to avoid re-downloading.
     
     Args:
         directory: Path to directory to scan
         
     Returns:
-        Set of file basenames (without extensions)
+        Frozen set of file basenames (without extensions)
         
     Example:
         If directory contains "Song.mp3" and "Track.m4a",
-        returns {"Song", "Track"}
+        returns frozenset({"Song", "Track"})
     """
-    if not os.path.exists(directory):
-        return set()
-    
     downloaded = set()
     try:
-        for filename in os.listdir(directory):
-            base, ext = os.path.splitext(filename)
-            if ext.lower() in AUDIO_EXTENSIONS:
-                downloaded.add(base)
+        # scandir's DirEntry.is_file() uses the directory entry type, no extra stat
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                base, ext = os.path.splitext(entry.name)
+                if ext.lower() in AUDIO_EXTENSIONS and entry.is_file():
+                    downloaded.add(base)
+    except FileNotFoundError:
+        return frozenset()
     except (OSError, PermissionError) as e:
         logging.warning(f"Error scanning directory {directory}: {e}")
     
-    return downloaded
+    return frozenset(downloaded)
 
 
+@functools.lru_cache(maxsize=4096)
 def simplify_search_query(title: str, artist: str) -> str:
     """
     Simplify song title and artist for better YouTube search results.
     
     Removes noise like parenthetical content, remix tags, and features
-    to improve search accuracy.
+    to improve search accuracy. Results are memoized, since the same
+    track often appears in several playlists.
     
     Args:
         title: Song title
@@ -124,19 +191,11 @@ def simplify_search_query(title: str, artist: str) -> str:
         >>> simplify_search_query("Song (Remix) [Official]", "Artist feat. Other")
         'Song Artist'
     """
-    # Remove content in parentheses and brackets
-    title = re.sub(r'\([^)]*\)', '', title)
-    title = re.sub(r'\[[^\]]*\]', '', title)
-    
-    # Remove common noise words and patterns
-    title = re.sub(r'(?i)\bfeat\.?\s*[^-–—]*', '', title)
-    title = re.sub(r'(?i)\bft\.?\s*[^-–—]*', '', title)
-    title = re.sub(r'(?i)\bremix\b[^-–—]*', '', title)
-    title = re.sub(r'(?i)\bremastered\b', '', title)
-    title = re.sub(r'(?i)\bofficial\b', '', title)
+    # Remove bracketed content and common noise words in a single pass
+    title = _TITLE_NOISE.sub('', title)
     
     # Keep only content before dash (often separates title from version info)
-    title = title.split('-')[0].split('–')[0].split('—')[0]
+    title = _TITLE_DASH.split(title, 1)[0]
     
     # Normalize whitespace
     title = ' '.join(title.split())
@@ -145,9 +204,10 @@ def simplify_search_query(title: str, artist: str) -> str:
     return f"{title} {artist}".strip()
 
 
-def ensure_directory(path: str) -> None:
+def ensure_directory(path: Union[str, Path]) -> None:
     """
     Ensure directory exists, creating it if necessary.
+    Each path is only checked once per process.
     
     Args:
         path: Directory path to ensure exists
@@ -155,7 +215,14 @@ def ensure_directory(path: str) -> None:
     Raises:
         OSError: If directory cannot be created
     """
-    Path(path).mkdir(parents=True, exist_ok=True)
+    key = str(path)
+    if key in _ENSURED_DIRS:
+        return
+    
+    directory = Path(path)
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
 
 
 def validate_url(url: str, url_type: str = 'spotify') -> bool:
@@ -173,14 +240,170 @@ def validate_url(url: str, url_type: str = 'spotify') -> bool:
         >>> validate_url("https://open.spotify.com/playlist/ABC", 'spotify')
         True
     """
-    if url_type == 'spotify':
-        pattern = r'https?://open\.spotify\.com/playlist/[\w\d]+'
-    elif url_type == 'youtube':
-        pattern = r'https?://(www\.)?(youtube\.com/playlist\?list=|youtu\.be/)[\w\-]+'
-    else:
-        return False
+    pattern = _PLAYLIST_URL_PATTERNS.get(url_type)
+    return bool(pattern and pattern.match(url))
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON text (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def _fast_json_hook(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """requests response hook that makes response.json() use json_loads."""
+    response.json = lambda **_: json_loads(response.content)
+    return response
+
+
+def enable_fast_json(session: Any) -> Any:
+    """
+    Make a requests.Session parse JSON responses with orjson, if installed.
+    
+    Args:
+        session: requests.Session (e.g. the one handed to spotipy)
+        
+    Returns:
+        The same session, for chaining
+    """
+    if ORJSON_AVAILABLE and _fast_json_hook not in session.hooks['response']:
+        session.hooks['response'].append(_fast_json_hook)
+    return session
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create the HTTP session shared by every in-process client for this run.
     
-    return bool(re.match(pattern, url))
+    Returns:
+        requests.Session with a keep-alive connection pool and 429 retries
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=HTTP_RETRY
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Spotify API responses on this session parse with orjson when installed
+    return enable_fast_json(session)
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter with sync and async acquire.
+    
+    Allows bursts of up to `rate` calls and an average of `rate` calls per
+    second. The rate is halved (down to min_rate) each time the remote side
+    reports that we are being rate limited.
+    """
+    
+    def __init__(self, rate: float = 10.0, min_rate: float = 0.5):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rate: Maximum average calls per second
+            min_rate: Lowest rate slow_down() may reduce to
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Consume one token now and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+    
+    def acquire(self) -> None:
+        """Block until a call is allowed (the wait is slept outside the lock)."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a call is allowed."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+    
+    def slow_down(self) -> None:
+        """Halve the allowed rate after a rate-limit response."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.capacity = max(1.0, self.rate)
+            self.tokens = min(self.tokens, self.capacity)
+
+
+class PeriodicFlushHandler(MemoryHandler):
+    """
+    MemoryHandler that also flushes every `interval` seconds.
+    
+    A single daemon thread per handler does the periodic flushing and
+    stops when the handler is closed (logging.shutdown closes it at exit).
+    """
+    
+    def __init__(self, capacity: int, flushLevel: int, target: logging.Handler,
+                 flushOnClose: bool, interval: float):
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=flushOnClose)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(interval,), name='log-flush', daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_loop(self, interval: float) -> None:
+        """Flush every interval seconds until the handler is closed."""
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+    
+    def close(self) -> None:
+        """Stop the flush thread, then flush and close as MemoryHandler does."""
+        self._stop_flushing.set()
+        super().close()
+
+
+def buffered_file_handler(log_file: str, formatter: logging.Formatter) -> MemoryHandler:
+    """
+    Create a file handler that batches records in memory.
+    
+    Records are flushed to disk when the buffer fills, when an ERROR (or
+    higher) record arrives, every LOG_FLUSH_INTERVAL seconds, and on
+    logging shutdown.
+    
+    Args:
+        log_file: Path to the log file
+        formatter: Formatter applied to the underlying file handler
+        
+    Returns:
+        MemoryHandler wrapping a FileHandler for log_file
+    """
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    
+    return PeriodicFlushHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+        interval=LOG_FLUSH_INTERVAL
+    )
 
 
 def setup_logging(log_dir: str = "logs", log_level: int = logging.INFO) -> logging.Logger:
@@ -205,8 +428,7 @@ def setup_logging(log_dir: str = "logs", log_level: int = logging.INFO) -> loggi
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     # Create handlers
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setFormatter(logging.Formatter(log_format))
+    file_handler = buffered_file_handler(log_file, logging.Formatter(log_format))
     
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
@@ -242,9 +464,10 @@ def format_duration(milliseconds: int) -> str:
     minutes, seconds = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
     
+    # %-formatting with a tuple is a single C call, cheaper than per-field __format__
     if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-    return f"{minutes:02d}:{seconds:02d}"
+        return '%02d:%02d:%02d' % (hours, minutes, seconds)
+    return '%02d:%02d' % (minutes, seconds)
 
 
 def calculate_statistics(total: int, downloaded: int, failed: int) -> dict: